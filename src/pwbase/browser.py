@@ -22,22 +22,167 @@ Usage::
 Notes:
     - ``headless``, ``state_path``, ``viewport``, and related options are ignored in CDP mode.
     - ``save_state()`` is not available in CDP mode.
+    - With ``share_browser=True``, every ``Browser`` using the same launch options
+      on the same event loop reuses one Playwright + Chromium process and only
+      gets its own ``BrowserContext``.  The process is torn down once the last
+      sharing ``Browser`` stops.
+    - ``warm_pool_size`` (with ``share_browser=True``) keeps that many contexts
+      pre-created in the background so ``start()`` only has to pop one.
+      Browsers with different sizes keep separate pools.  Browsers that load
+      stored state always create a fresh context.
 """
 
 import asyncio
 import logging
-from contextlib import AsyncExitStack
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack, suppress
 from pathlib import Path
 from types import TracebackType
 from typing import Any, Self
+from weakref import WeakKeyDictionary
 
 from playwright.async_api import Browser as PWBrowser
 from playwright.async_api import BrowserContext, Page, Playwright, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright_stealth import Stealth
 
 from .browser_config import BrowserConfig
 from .browser_type import BrowserType
 
+_SharedKey = tuple[BrowserType, str, bool, tuple[str, ...]]
+
+
+class _WarmPool:
+    """Pre-created ``BrowserContext`` objects kept ready on a shared ``PWBrowser``.
+
+    ``get()`` hands out a pre-created context when one is queued and falls back
+    to creating one inline otherwise; either way a background task tops the
+    queue back up to ``size``.
+    """
+
+    def __init__(self, browser: PWBrowser, options: dict[str, Any], size: int):
+        self._browser = browser
+        self._options = options
+        self._size = size
+        self._contexts: asyncio.Queue[BrowserContext] = asyncio.Queue()
+        self._refill_task: asyncio.Task[None] | None = None
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    async def get(self) -> BrowserContext:
+        try:
+            context = self._contexts.get_nowait()
+        except asyncio.QueueEmpty:
+            context = await self._browser.new_context(**self._options)
+        self._schedule_refill()
+        return context
+
+    async def close(self) -> None:
+        if self._refill_task:
+            self._refill_task.cancel()
+            try:
+                await self._refill_task
+            except asyncio.CancelledError:
+                pass
+            self._refill_task = None
+        while not self._contexts.empty():
+            await self._contexts.get_nowait().close()
+
+    def _schedule_refill(self) -> None:
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self._refill())
+
+    async def _refill(self) -> None:
+        try:
+            while self._contexts.qsize() < self._size:
+                self._contexts.put_nowait(
+                    await self._browser.new_context(**self._options)
+                )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.debug("Failed to pre-create browser context: %s", e)
+
+
+class _SharedBrowser:
+    """A launched ``PWBrowser`` plus the exit stack that owns its Playwright driver."""
+
+    def __init__(self, key: _SharedKey, browser: PWBrowser, exit_stack: AsyncExitStack):
+        self.key = key
+        self.browser = browser
+        self.exit_stack = exit_stack
+        self.refcount = 0
+        self._warm_pools: dict[str, _WarmPool] = {}
+        exit_stack.push_async_callback(self._close_warm_pools)
+
+    def warm_pool(self, options: dict[str, Any], size: int) -> _WarmPool:
+        """Return the warm pool for ``options`` and ``size``, creating it if needed."""
+        pool_key = repr((size, sorted(options.items())))
+        pool = self._warm_pools.get(pool_key)
+        if pool is None:
+            pool = self._warm_pools[pool_key] = _WarmPool(self.browser, options, size)
+        return pool
+
+    async def _close_warm_pools(self) -> None:
+        pools = list(self._warm_pools.values())
+        self._warm_pools.clear()
+        for pool in pools:
+            await pool.close()
+
+
+class _BrowserRegistry:
+    """Refcounted ``PWBrowser`` instances shared across ``Browser`` objects on one event loop."""
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._entries: dict[_SharedKey, _SharedBrowser] = {}
+
+    async def acquire(
+        self, key: _SharedKey, launch: Callable[[], Awaitable[_SharedBrowser]]
+    ) -> _SharedBrowser:
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = await launch()
+                self._entries[key] = entry
+            entry.refcount += 1
+            return entry
+
+    async def release(self, entry: _SharedBrowser) -> None:
+        async with self._lock:
+            entry.refcount -= 1
+            if entry.refcount > 0 or self._entries.get(entry.key) is not entry:
+                return
+            del self._entries[entry.key]
+        await entry.exit_stack.aclose()
+
+
+# Playwright objects are bound to the loop they were created on, so each loop
+# gets its own registry.
+_REGISTRIES: WeakKeyDictionary[asyncio.AbstractEventLoop, _BrowserRegistry] = (
+    WeakKeyDictionary()
+)
+
+
+def _registry() -> _BrowserRegistry:
+    loop = asyncio.get_running_loop()
+    registry = _REGISTRIES.get(loop)
+    if registry is None:
+        registry = _REGISTRIES[loop] = _BrowserRegistry()
+    return registry
+
+
+async def _cancel_task(task: asyncio.Task[None]) -> None:
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+
+# Name of the ``Browser`` method that opens each mode.  Looked up on the
+# instance so subclasses can override a single mode.
+_LAUNCHERS: dict[BrowserType, str] = {
+    BrowserType.CDP: "_connect_cdp",
+    BrowserType.STEALTH: "_launch_stealth",
+    BrowserType.DEFAULT: "_launch_default",
+}
+
 
 class Browser:
     def __init__(self, config: BrowserConfig | None = None):
@@ -45,6 +190,8 @@ class Browser:
         self._playwright: Playwright | None = None
         self._browser: PWBrowser | None = None
         self._exit_stack: AsyncExitStack | None = None
+        self._shared: _SharedBrowser | None = None
+        self._keepalive_task: asyncio.Task[None] | None = None
         self.context: BrowserContext | None = None
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
@@ -54,16 +201,14 @@ class Browser:
                 "Browser already started. Call stop() before starting again."
             )
         self.logger.info("Starting browser in %s mode", self.config.type)
+        # Every resource opened below registers its own teardown here, so
+        # stop() only has to unwind this one stack.
+        exit_stack = self._exit_stack = AsyncExitStack()
         try:
-            match self.config.type:
-                case BrowserType.CDP:
-                    await self._connect_cdp()
-                case BrowserType.STEALTH:
-                    await self._launch_stealth()
-                case BrowserType.DEFAULT:
-                    await self._launch_default()
-                case _:
-                    raise ValueError(f"Unsupported BrowserType: {self.config.type}")
+            launcher = _LAUNCHERS.get(self.config.type)
+            if launcher is None:
+                raise ValueError(f"Unsupported BrowserType: {self.config.type}")
+            await getattr(self, launcher)(exit_stack)
         except Exception:
             await self.stop()
             raise
@@ -71,22 +216,16 @@ class Browser:
     async def stop(self) -> None:
         """Idempotent — safe to call even if the browser was never fully started."""
         self.logger.info("Stopping browser")
+        exit_stack, self._exit_stack = self._exit_stack, None
         try:
-            if self.context and self.config.type != BrowserType.CDP:
-                await self.context.close()
+            if exit_stack:
+                await exit_stack.aclose()
         finally:
-            try:
-                if self._browser:
-                    await self._browser.close()
-            finally:
-                if self._exit_stack:
-                    await self._exit_stack.aclose()
-                elif self._playwright:
-                    await self._playwright.stop()
-                self._browser = None
-                self.context = None
-                self._playwright = None
-                self._exit_stack = None
+            self._browser = None
+            self.context = None
+            self._playwright = None
+            self._shared = None
+            self._keepalive_task = None
 
     async def __aenter__(self) -> Self:
         await self.start()
@@ -100,42 +239,137 @@ class Browser:
     ) -> None:
         await self.stop()
 
-    async def _launch_default(self) -> None:
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.config.headless,
-            args=self.config.args,
+    async def _launch_default(self, exit_stack: AsyncExitStack) -> None:
+        await self._launch(self._open_default, exit_stack)
+
+    async def _launch_stealth(self, exit_stack: AsyncExitStack) -> None:
+        await self._launch(self._open_stealth, exit_stack)
+
+    async def _launch(
+        self,
+        open_browser: Callable[[AsyncExitStack], Awaitable[None]],
+        exit_stack: AsyncExitStack,
+    ) -> None:
+        if self.config.share_browser:
+            open_browser = self._acquire_shared_browser
+        # Context options don't depend on the browser, so build them while it
+        # launches.  Both are awaited to completion before any error is raised.
+        opened, options = await asyncio.gather(
+            open_browser(exit_stack), self._context_options(), return_exceptions=True
         )
-        self.context = await self._browser.new_context(**await self._context_options())
+        for result in (opened, options):
+            if isinstance(result, BaseException):
+                raise result
+        self.context = await self._new_context(options)
+        exit_stack.push_async_callback(self.context.close)
 
-    async def _launch_stealth(self) -> None:
-        self._exit_stack = AsyncExitStack()
-        self._playwright = await self._exit_stack.enter_async_context(
+    async def _open_default(self, exit_stack: AsyncExitStack) -> None:
+        self._playwright = await async_playwright().start()
+        exit_stack.push_async_callback(self._playwright.stop)
+        self._browser = await self._playwright.chromium.launch(**self._launch_options())
+        exit_stack.push_async_callback(self._browser.close)
+
+    async def _open_stealth(self, exit_stack: AsyncExitStack) -> None:
+        self._playwright = await exit_stack.enter_async_context(
             Stealth().use_async(async_playwright())
         )
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.config.headless,
-            channel=self.config.channel,
-            args=self.config.args,
+        self._browser = await self._playwright.chromium.launch(**self._launch_options())
+        exit_stack.push_async_callback(self._browser.close)
+
+    def _launch_options(self) -> dict[str, Any]:
+        cfg = self.config
+        options: dict[str, Any] = {"headless": cfg.headless, "args": cfg.args}
+        if cfg.type == BrowserType.STEALTH:
+            options["channel"] = cfg.channel
+        return options
+
+    async def _new_context(self, options: dict[str, Any]) -> BrowserContext:
+        # HAR contexts write their own file on close, and stored state is read
+        # from disk when the context is created (and may since have been
+        # re-saved), so neither can be pre-created.
+        if (
+            self._shared is not None
+            and self.config.warm_pool_size > 0
+            and "record_har_path" not in options
+            and options.get("storage_state") is None
+        ):
+            pool = self._shared.warm_pool(options, self.config.warm_pool_size)
+            return await pool.get()
+        return await self._browser.new_context(**options)
+
+    async def _acquire_shared_browser(self, exit_stack: AsyncExitStack) -> None:
+        cfg = self.config
+        key: _SharedKey = (cfg.type, cfg.channel, cfg.headless, cfg.args)
+        registry = _registry()
+        self._shared = await registry.acquire(
+            key, lambda: self._launch_shared_browser(key)
         )
-        self.context = await self._browser.new_context(**await self._context_options())
+        exit_stack.push_async_callback(registry.release, self._shared)
+        self._browser = self._shared.browser
 
-    async def _connect_cdp(self) -> None:
+    async def _launch_shared_browser(self, key: _SharedKey) -> _SharedBrowser:
+        exit_stack = AsyncExitStack()
+        try:
+            if self.config.type == BrowserType.STEALTH:
+                playwright = await exit_stack.enter_async_context(
+                    Stealth().use_async(async_playwright())
+                )
+            else:
+                playwright = await async_playwright().start()
+                exit_stack.push_async_callback(playwright.stop)
+            browser = await playwright.chromium.launch(**self._launch_options())
+            exit_stack.push_async_callback(browser.close)
+        except BaseException:
+            await exit_stack.aclose()
+            raise
+        self.logger.info("Launched shared browser for %s mode", self.config.type)
+        return _SharedBrowser(key, browser, exit_stack)
+
+    async def _connect_cdp(self, exit_stack: AsyncExitStack) -> None:
+        cfg = self.config
         self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.connect_over_cdp(
-            self.config.cdp_url
-        )
+        exit_stack.push_async_callback(self._playwright.stop)
+        # The CDP WebSocket is opened by Playwright's Node driver, not Python.
+        # It only deflates frames above 10 KiB and runs with TCP_NODELAY, so the
+        # small per-response messages are already sent uncompressed and unbatched;
+        # there is no client-side transport option to tune here.
+        try:
+            self._browser = await self._playwright.chromium.connect_over_cdp(
+                cfg.cdp_url, timeout=cfg.cdp_connect_timeout * 1000
+            )
+        except PlaywrightTimeoutError as e:
+            raise TimeoutError(
+                f"Timed out after {cfg.cdp_connect_timeout}s connecting to {cfg.cdp_url}. "
+                "Ensure Chrome is running with --remote-debugging-port."
+            ) from e
+        exit_stack.push_async_callback(self._browser.close)
         if not self._browser.contexts:
             raise RuntimeError(
                 "CDP browser has no open contexts. Ensure Chrome has at least one window open."
             )
+        # The context is borrowed from the running Chrome, so nothing is pushed
+        # to close it; disconnecting the browser leaves it open.
         self.context = self._browser.contexts[0]
+        if cfg.cdp_keepalive_interval > 0:
+            self._keepalive_task = asyncio.create_task(self._cdp_keepalive())
+            exit_stack.push_async_callback(_cancel_task, self._keepalive_task)
+
+    async def _cdp_keepalive(self) -> None:
+        """Send a cheap CDP command periodically so idle connections aren't dropped."""
+        if not self._browser:
+            return
+        try:
+            session = await self._browser.new_browser_cdp_session()
+            while True:
+                await asyncio.sleep(self.config.cdp_keepalive_interval)
+                await session.send("Browser.getVersion")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.debug("CDP keep-alive stopped: %s", e)
 
     async def _context_options(self) -> dict[str, Any]:
         cfg = self.config
-        path_exists = (
-            await asyncio.to_thread(cfg.state_path.exists) if cfg.state_path else False
-        )
+        # A local stat is far cheaper than a thread-pool hop, so call it inline.
+        path_exists = cfg.state_path.exists() if cfg.state_path else False
         storage = str(cfg.state_path) if cfg.state_path and path_exists else None
         if cfg.state_path and not path_exists:
             self.logger.warning(
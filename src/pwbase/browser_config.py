@@ -3,24 +3,40 @@ BrowserConfig
 =============
 Configuration dataclass for ``Browser`` and its subclasses.
 
-CDP-only fields:   ``cdp_url``
+CDP-only fields:   ``cdp_url``, ``cdp_connect_timeout``, ``cdp_keepalive_interval``
 Non-CDP fields:    ``headless``, ``state_path``, ``channel``, ``viewport``,
-                   ``user_agent``, ``locale``, ``timezone``, ``args``
+                   ``user_agent``, ``locale``, ``timezone``, ``args``,
+                   ``share_browser``, ``warm_pool_size``
+Extractor fields:  ``max_captured_responses``
+
+``share_browser`` reuses one Chromium process across every ``Browser`` with
+the same ``type``, ``channel``, ``headless`` and ``args``; each ``Browser``
+still gets its own isolated ``BrowserContext``.  ``warm_pool_size`` only
+applies to shared browsers: that many contexts are pre-created in the
+background so ``start()`` can pop one instead of waiting on ``new_context``.
+
+``max_captured_responses`` caps how many responses a ``BrowserSessionExtractor``
+keeps; the oldest are discarded first.  ``None`` keeps every response.
+
+Configs are frozen and hashable; use ``dataclasses.replace()`` to derive a
+variant.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 
 from .browser_type import BrowserType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BrowserConfig:
     type: BrowserType = BrowserType.DEFAULT
     headless: bool = True
     state_path: Path | None = None
     channel: str = "chrome"
     cdp_url: str = "http://localhost:9222"
+    cdp_connect_timeout: float = 15.0  # seconds
+    cdp_keepalive_interval: float = 25.0  # seconds; 0 disables the keep-alive ping
     viewport: tuple[int, int] = (1920, 1080)
     user_agent: str = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -29,9 +45,18 @@ class BrowserConfig:
     )
     locale: str = "en-US"
     timezone: str = "America/New_York"
-    args: list[str] = field(
-        default_factory=lambda: [
-            "--disable-blink-features=AutomationControlled",
-            "--no-sandbox",
-        ]
+    args: tuple[str, ...] = (
+        "--disable-blink-features=AutomationControlled",
+        "--no-sandbox",
     )
+    share_browser: bool = False
+    warm_pool_size: int = 0
+    max_captured_responses: int | None = 10_000
+
+    def __post_init__(self) -> None:
+        if self.max_captured_responses is not None and self.max_captured_responses < 1:
+            raise ValueError("max_captured_responses must be at least 1 or None")
+        # Accept any iterable (e.g. a list) for ``args`` but store a tuple so the
+        # config stays hashable.
+        if not isinstance(self.args, tuple):
+            object.__setattr__(self, "args", tuple(self.args))
@@ -15,69 +15,220 @@ Usage::
         session = browser.to_session(response)
 """
 
+import asyncio
 import json
 import logging
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from typing import Any
 
 import requests
 from playwright._impl._api_structures import Cookie
-from playwright.async_api import Page, Response
+from playwright.async_api import BrowserContext, Page, Response
 
 from .browser import Browser
 from .browser_config import BrowserConfig
-from .schema import CapturedResponse
+from .schema import CapturedResponse, decode_json
+
+
+# Header values at or above this length (tokens, CSP policies, ...) are rarely
+# repeated across responses, so interning them would only grow the intern table.
+_INTERN_MAX_LEN = 64
+
+
+def _intern_headers(headers: dict[str, str]) -> dict[str, str]:
+    """Intern header names and short values so repeats across responses share storage."""
+    return {
+        sys.intern(k): sys.intern(v) if len(v) < _INTERN_MAX_LEN else v
+        for k, v in headers.items()
+    }
 
 
 class BrowserSessionExtractor(Browser):
     def __init__(self, config: BrowserConfig | None = None):
         super().__init__(config)
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self.responses: list[CapturedResponse] = []
+        # Bounded by ``config.max_captured_responses``; the oldest responses are
+        # discarded once it is full.
+        self.responses: deque[CapturedResponse] = deque(
+            maxlen=self.config.max_captured_responses
+        )
         self._page: Page | None = None
+        # (response, time.monotonic() when recorded), oldest first.  Kept as
+        # pairs because ``responses`` may also be changed directly.
+        self._captured_at: deque[tuple[CapturedResponse, float]] = deque(
+            maxlen=self.config.max_captured_responses
+        )
+        self._waiters: list[tuple[str, asyncio.Future[CapturedResponse]]] = []
+        # url -> (sequence number, pending context.cookies(url)) while in flight.
+        self._cookie_fetches: dict[str, tuple[int, asyncio.Future[list[Cookie]]]] = {}
+        # Number of cookie fetches requested so far.
+        self._cookie_fetch_count = 0
+        self._url_filter: Callable[[str], bool] | None = None
+        self._methods: frozenset[str] | None = None
+        self._capture_all_headers = False
+        self._lazy_body = False
+
+    async def start_recording(
+        self,
+        page: Page,
+        url_filter: Callable[[str], bool] | None = None,
+        methods: Iterable[str] | None = None,
+        capture_all_headers: bool = False,
+        lazy_body: bool = False,
+    ) -> None:
+        """
+        Begin intercepting JSON responses on ``page``.
 
-    async def start_recording(self, page: Page) -> None:
-        """Begin intercepting JSON responses on ``page``."""
+        ``url_filter`` and ``methods`` narrow what is captured; responses they
+        reject are skipped before any body, header or cookie lookups.
+
+        Headers are taken from the ``headers`` already delivered with the
+        response event, which omits security-related headers such as
+        ``cookie`` / ``set-cookie``.  Set ``capture_all_headers`` to fetch the
+        complete header sets at the cost of two extra round-trips per response.
+
+        With ``lazy_body``, only the raw JSON bytes are kept and
+        ``CapturedResponse.body`` decodes them again on first access, so
+        responses that are never read hold compact bytes rather than decoded
+        objects.  Bodies are still checked when captured, so invalid JSON is
+        skipped either way.
+        """
         self._page = page
-        self.responses.clear()
+        self._url_filter = url_filter
+        self._capture_all_headers = capture_all_headers
+        self._lazy_body = lazy_body
+        self._methods = frozenset(m.upper() for m in methods) if methods else None
+        self.clear()
+        self._cookie_fetches.clear()
         page.on("response", self._handle_response)
 
     def stop_recording(self) -> None:
-        """Stop intercepting responses. Safe to call if recording was never started."""
+        """
+        Stop intercepting responses. Safe to call if recording was never started.
+
+        Pending ``wait_for_response()`` calls raise ``RuntimeError``.
+        """
         if self._page:
             self._page.remove_listener("response", self._handle_response)
             self._page = None
+        waiters, self._waiters = self._waiters, []
+        for _, future in waiters:
+            if not future.done():
+                future.set_exception(
+                    RuntimeError("Recording stopped while waiting for a response.")
+                )
+
+    async def stop(self) -> None:
+        """Stop recording, then close the browser."""
+        self.stop_recording()
+        await super().stop()
+
+    def _is_wanted(self, response: Response) -> bool:
+        if self._methods is not None and (
+            response.request.method.upper() not in self._methods
+        ):
+            return False
+        return self._url_filter is None or self._url_filter(response.url)
+
+    async def _cookies_for(
+        self, context: BrowserContext, url: str, after: int
+    ) -> list[Cookie]:
+        """
+        Return ``context.cookies(url)``, sharing a fetch already in flight for ``url``.
+
+        ``after`` is the number of fetches that had been requested when the
+        response arrived; only a fetch requested since then is shared, since
+        an older one may predate the response's ``Set-Cookie``.
+        """
+        fetch = self._cookie_fetches.get(url)
+        if fetch is None or fetch[0] <= after:
+            self._cookie_fetch_count += 1
+            fetch = (
+                self._cookie_fetch_count,
+                asyncio.ensure_future(context.cookies(url)),
+            )
+            self._cookie_fetches[url] = fetch
+        try:
+            return await asyncio.shield(fetch[1])
+        finally:
+            if self._cookie_fetches.get(url) is fetch:
+                del self._cookie_fetches[url]
+
+    async def _fetch_parts(
+        self, response: Response
+    ) -> tuple[bytes, dict[str, Any]] | None:
+        """
+        Fetch the body, both header sets and cookies for ``response`` concurrently.
+
+        Returns the raw body and the remaining ``CapturedResponse`` fields.
+
+        The full header sets are only requested when ``capture_all_headers`` was
+        set; otherwise the headers that arrived with the response event are used.
+
+        Returns ``None`` (after logging) when there is no context or the body
+        cannot be read; any other failure is re-raised.
+        """
+        if not self.context:
+            self.logger.warning(
+                "No browser context available; skipping %s", response.url
+            )
+            return None
+        after = self._cookie_fetch_count
+        if self._capture_all_headers:
+            raw_body, headers, request_headers, cookies = await asyncio.gather(
+                response.body(),
+                response.all_headers(),
+                response.request.all_headers(),
+                self._cookies_for(self.context, response.url, after),
+                return_exceptions=True,
+            )
+        else:
+            raw_body, cookies = await asyncio.gather(
+                response.body(),
+                self._cookies_for(self.context, response.url, after),
+                return_exceptions=True,
+            )
+            headers, request_headers = response.headers, response.request.headers
+        if isinstance(raw_body, BaseException):
+            self.logger.debug(
+                "Failed to get response body from %s: %s", response.url, raw_body
+            )
+            return None
+        for result in (headers, request_headers, cookies):
+            if isinstance(result, BaseException):
+                raise result
+        return raw_body, {
+            "url": response.url,
+            "method": response.request.method,
+            "headers": _intern_headers(headers),
+            "request_headers": _intern_headers(request_headers),
+            "request_post_data": response.request.post_data,
+            "cookies": cookies,
+        }
 
     async def _handle_response(self, response: Response) -> None:
         try:
+            if not self._is_wanted(response):
+                return
             if "application/json" not in response.headers.get("content-type", ""):
                 return
+            parts = await self._fetch_parts(response)
+            if parts is None:
+                return
+            raw_body, fields = parts
             try:
-                raw_body = await response.body()
-                body = json.loads(raw_body)
+                body = decode_json(raw_body)
             except json.JSONDecodeError:
                 self.logger.debug("Failed to decode JSON from %s", response.url)
                 return
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                self.logger.debug(
-                    "Failed to get response body from %s: %s", response.url, e
-                )
-                return
-            if not self.context:
-                self.logger.warning(
-                    "No browser context available; skipping %s", response.url
-                )
-                return
-            cookies: list[Cookie] = await self.context.cookies(response.url)
-            self.responses.append(
-                CapturedResponse(
-                    url=response.url,
-                    method=response.request.method,
-                    headers=dict(await response.all_headers()),
-                    body=body,
-                    request_headers=dict(await response.request.all_headers()),
-                    request_post_data=response.request.post_data,
-                    cookies=cookies,
-                )
-            )
+            if self._lazy_body:
+                self._record(CapturedResponse.with_raw_body(raw_body, **fields))
+            else:
+                self._record(CapturedResponse(body=body, **fields))
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.debug("Error in response handler: %s", e)
 
@@ -91,21 +242,96 @@ class BrowserSessionExtractor(Browser):
         """Return all captured responses whose URL contains ``url_contains``."""
         return [r for r in self.responses if url_contains in r.url]
 
+    def clear(self) -> None:
+        """Discard every captured response."""
+        self.responses.clear()
+        self._captured_at.clear()
+
+    def drop_older_than(self, seconds: float) -> int:
+        """
+        Discard responses captured more than ``seconds`` ago.
+
+        Capture times are only tracked for responses recorded by
+        ``start_recording()``; responses added to ``responses`` directly count
+        as captured when ``drop_older_than()`` first sees them.  Returns the
+        number of responses discarded.
+        """
+        responses = self.responses
+        now = time.monotonic()
+        recorded = {id(r): at for r, at in self._captured_at}
+        times = [recorded.get(id(r), now) for r in responses]
+        cutoff = now - seconds
+        dropped = 0
+        while dropped < len(times) and times[dropped] < cutoff:
+            dropped += 1
+        if isinstance(responses, deque):
+            for _ in range(dropped):
+                responses.popleft()
+        else:
+            del responses[:dropped]
+        self._captured_at = deque(
+            zip(responses, times[dropped:]), maxlen=self._captured_at.maxlen
+        )
+        return dropped
+
+    def _record(self, captured: CapturedResponse) -> None:
+        self.responses.append(captured)
+        self._captured_at.append((captured, time.monotonic()))
+        if not self._waiters:
+            return
+        pending: list[tuple[str, asyncio.Future[CapturedResponse]]] = []
+        for url_contains, future in self._waiters:
+            if future.done():
+                continue
+            if url_contains in captured.url:
+                future.set_result(captured)
+            else:
+                pending.append((url_contains, future))
+        self._waiters = pending
+
     async def wait_for_response(
-        self, url_contains: str, timeout: int = 1
+        self,
+        url_contains: str,
+        *,
+        timeout: float | None = None,
+        poll_interval: float | None = None,
     ) -> CapturedResponse:
         """
-        Poll until a matching response is captured.
+        Wait until a response whose URL contains ``url_contains`` is captured.
 
-        ``timeout`` controls the poll interval in seconds, not a hard deadline.
+        Returns as soon as the recorder captures a match.  ``timeout`` is a hard
+        deadline in seconds (``TimeoutError`` when exceeded); ``None`` waits
+        indefinitely.  Pass ``poll_interval`` to poll ``responses`` instead,
+        e.g. when responses are added to it outside the recorder.  Raises
+        ``RuntimeError`` if recording stops first.
         """
         if not self._page:
             raise RuntimeError(
                 "No page is being recorded. Call start_recording() first."
             )
         captured = self.find_response(url_contains)
+        if captured:
+            return captured
+        if poll_interval is not None:
+            return await asyncio.wait_for(
+                self._poll_for_response(url_contains, poll_interval), timeout
+            )
+        waiter = (url_contains, asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(waiter[1], timeout)
+        finally:
+            with suppress(ValueError):
+                self._waiters.remove(waiter)
+
+    async def _poll_for_response(
+        self, url_contains: str, poll_interval: float
+    ) -> CapturedResponse:
+        captured = self.find_response(url_contains)
         while not captured:
-            await self._page.wait_for_timeout(1000 * timeout)
+            if not self._page:
+                raise RuntimeError("Recording stopped while waiting for a response.")
+            await self._page.wait_for_timeout(1000 * poll_interval)
             captured = self.find_response(url_contains)
         return captured
 
@@ -142,36 +368,29 @@ class AllRequestExtractor(BrowserSessionExtractor):
         try:
             if response.request.method.upper() not in ("GET", "POST"):
                 return
+            if not self._is_wanted(response):
+                return
             content_type = response.headers.get("content-type", "")
             if any(exc in content_type for exc in self.exclude_content_types):
                 return
+            parts = await self._fetch_parts(response)
+            if parts is None:
+                return
+            raw_body, fields = parts
+            is_json = "application/json" in content_type
             try:
-                raw_body = await response.body()
-                if "application/json" in content_type:
-                    body: dict | list | str | None = json.loads(raw_body)
+                if is_json:
+                    body: dict | list | str | None = decode_json(raw_body)
                 else:
                     body = raw_body.decode("utf-8", errors="replace")
             except Exception as e:  # pylint: disable=broad-exception-caught
                 self.logger.debug(
-                    "Failed to get response body from %s: %s", response.url, e
+                    "Failed to decode response body from %s: %s", response.url, e
                 )
                 return
-            if not self.context:
-                self.logger.warning(
-                    "No browser context available; skipping %s", response.url
-                )
-                return
-            cookies: list[Cookie] = await self.context.cookies(response.url)
-            self.responses.append(
-                CapturedResponse(
-                    url=response.url,
-                    method=response.request.method,
-                    headers=dict(await response.all_headers()),
-                    body=body,
-                    request_headers=dict(await response.request.all_headers()),
-                    request_post_data=response.request.post_data,
-                    cookies=cookies,
-                )
-            )
+            if is_json and self._lazy_body:
+                self._record(CapturedResponse.with_raw_body(raw_body, **fields))
+            else:
+                self._record(CapturedResponse(body=body, **fields))
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.debug("Error in response handler: %s", e)
@@ -4,18 +4,103 @@ CapturedResponse
 Data model representing a captured HTTP response from a browser session,
 with methods to serialize/deserialize from JSON and convert to authenticated
 requests.Session objects.
+
+Bodies can be captured undecoded with ``CapturedResponse.with_raw_body()``;
+they are then decoded on first access to ``body``.
+
+Sessions built by ``to_session()`` share one set of pooled ``HTTPAdapter``
+instances, so connections to the same host are reused across sessions.
 """
 
 import json
+from collections import OrderedDict
+from http.cookiejar import Cookie as _JarCookie
 from dataclasses import asdict, dataclass, field
+from functools import cache
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 import requests
 from playwright._impl._api_structures import Cookie
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def decode_json(raw: bytes) -> dict | list | str | None:
+    """Decode a JSON body, preferring ``orjson`` when it is installed.
+
+    ``orjson`` rejects a few inputs the stdlib accepts (``NaN``, integers wider
+    than 64 bits), so those fall back to ``json.loads`` to keep results identical.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+@cache
+def _template_session() -> requests.Session:
+    """Return the session whose adapters every ``to_session()`` result shares."""
+    session = requests.Session()
+    # Only retry failures where the request never reached the server.
+    retries = Retry(
+        total=2, connect=2, read=False, status=0, other=0, backoff_factor=0.1
+    )
+    for prefix in ("https://", "http://"):
+        session.mount(
+            prefix,
+            HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=retries),
+        )
+    return session
+
+
+class _PooledSession(requests.Session):
+    """A ``requests.Session`` mounted on the template session's shared adapters."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.adapters = OrderedDict(_template_session().adapters)
+
+    def close(self) -> None:
+        """Close adapters mounted on this session; the shared pools stay open."""
+        shared = _template_session().adapters.values()
+        for adapter in self.adapters.values():
+            if all(adapter is not pooled for pooled in shared):
+                adapter.close()
+
 
+def _jar_cookie(name: str, value: str, domain: str, path: str) -> _JarCookie:
+    """Build a jar cookie the way ``requests.cookies.create_cookie()`` would,
+    without its per-call defaults dict and keyword validation."""
+    return _JarCookie(
+        version=0,
+        name=name,
+        value=value,
+        port=None,
+        port_specified=False,
+        domain=domain,
+        domain_specified=bool(domain),
+        domain_initial_dot=domain.startswith("."),
+        path=path,
+        path_specified=bool(path),
+        secure=False,
+        expires=None,
+        discard=True,
+        comment=None,
+        comment_url=None,
+        rest={"HttpOnly": None},
+        rfc2109=False,
+    )
 
-@dataclass
+
+@dataclass(slots=True)
 class CapturedResponse:
     url: str
     method: str
@@ -24,11 +109,43 @@ class CapturedResponse:
     request_headers: dict[str, str]
     request_post_data: str | None = None
     cookies: list[Cookie] = field(default_factory=list)
+    # Undecoded JSON for a ``body`` slot that is left unset until first read.
+    _raw_body: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def with_raw_body(cls, raw_body: bytes, **fields) -> "CapturedResponse":
+        """
+        Build a response whose ``body`` is decoded from ``raw_body`` on first access.
+
+        ``raw_body`` must be valid JSON.  ``fields`` are the remaining
+        constructor arguments.
+        """
+        captured = cls(body=None, **fields)
+        del captured.body
+        captured._raw_body = raw_body
+        return captured
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup fails, i.e. for an unset slot.
+        if name == "body" and self._raw_body is not None:
+            self.body = decode_json(self._raw_body)
+            self._raw_body = None
+            return self.body
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def drop_body(self) -> None:
+        """Release the body (decoded or not), e.g. once ``to_session()`` has been built."""
+        self.body = None
+        self._raw_body = None
 
     def to_json_file(self, filename: str = "captured_response.json") -> None:
         """Write this captured response to a JSON file."""
+        data = asdict(self)
+        del data["_raw_body"]
         with open(filename, "w", encoding="utf-8") as file:
-            json.dump(asdict(self), file, indent=2)
+            json.dump(data, file, indent=2)
 
     def to_session(self) -> requests.Session:
         """
@@ -40,21 +157,36 @@ class CapturedResponse:
         The ``cookie`` header is excluded because it contains stale cookie values
         from the original request. Fresh cookies (including Set-Cookie updates)
         are applied via ``session.cookies`` instead.
+
+        The session's adapters (and their connection pools) are shared with
+        every other session built here; ``mount()`` on the returned session
+        only affects that session, and ``close()`` only closes adapters
+        mounted that way, leaving the shared pools open.  The shared adapters
+        retry a request up to twice when it fails before reaching the server
+        (e.g. a refused connection).
         """
+        session = _PooledSession()
+        self._apply_to_session(session)
+        return session
+
+    def _apply_to_session(self, session: requests.Session) -> None:
+        """Validate and apply this response's headers and cookies to ``session``."""
         if not isinstance(self.request_headers, dict):
             raise ValueError("request_headers must be a dictionary")
         if not isinstance(self.cookies, list):
             raise ValueError("cookies must be a list")
 
+        # Captured request_headers are kept unfiltered (they are what
+        # to_json_file() records, and files loaded from disk need filtering
+        # here anyway), so pseudo-headers and ``cookie`` are dropped now.
         normalized_headers: dict[str, str] = {}
         for key, value in self.request_headers.items():
             if not isinstance(key, str) or not isinstance(value, str):
                 raise ValueError("request_headers keys and values must be strings")
-            if not key.startswith(":") and key.lower() != "cookie":
+            if key[:1] != ":" and key.lower() != "cookie":
                 normalized_headers[key] = value
 
-        session = requests.Session()
-        session.headers.update(normalized_headers)
+        jar = requests.cookies.RequestsCookieJar()
         for cookie in self.cookies:
             if not isinstance(cookie, dict):
                 raise ValueError("Each cookie must be an object")
@@ -71,8 +203,12 @@ class CapturedResponse:
                 raise ValueError("Cookie 'domain' must be a string when provided")
             if path is not None and not isinstance(path, str):
                 raise ValueError("Cookie 'path' must be a string when provided")
-            session.cookies.set(name, value, domain=domain, path=path)
-        return session
+            jar.set_cookie(
+                _jar_cookie(name, value, domain or "", "/" if path is None else path)
+            )
+
+        session.headers.update(normalized_headers)
+        session.cookies = jar
 
     @staticmethod
     def from_json_file(filename: str = "captured_response.json") -> "CapturedResponse":  # pylint: disable=too-many-branches
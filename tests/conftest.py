@@ -1,8 +1,14 @@
 """Shared fixtures for pwbase tests."""
 
+import asyncio
+import os
+import re
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
+
+from pwbase import Browser, BrowserConfig, BrowserType
 
 
 @pytest.fixture
@@ -55,3 +61,43 @@ def mock_async_playwright(mock_playwright):  # pylint: disable=redefined-outer-n
     cm.__aexit__ = AsyncMock(return_value=None)
     cm.start = AsyncMock(return_value=mock_playwright)
     return cm
+
+
+# ── Real browsers ─────────────────────────────────────────────────────────────
+#
+# Each fixture holds one ``share_browser`` Browser open for the whole session,
+# so every real test that also sets ``share_browser=True`` (on the session
+# event loop) reuses its Chromium process and only creates a new context.
+#
+# Session scope is per process, so under pytest-xdist (``pytest -n auto``) each
+# worker holds its own browser and the workers' tests run their navigations
+# concurrently.  Every worker starts its session at the same moment, so
+# each worker's launch is delayed by a slice of its index to keep N Chromium
+# processes from spawning in lockstep.
+
+# Delay (seconds) between consecutive xdist workers' shared browser launches.
+_XDIST_LAUNCH_STAGGER = 0.25
+
+
+async def _stagger_launch() -> None:
+    match = re.fullmatch(r"gw(\d+)", os.environ.get("PYTEST_XDIST_WORKER", ""))
+    if match:
+        await asyncio.sleep(int(match.group(1)) * _XDIST_LAUNCH_STAGGER)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_default_browser():
+    """A headless DEFAULT-mode browser process shared across the session."""
+    config = BrowserConfig(type=BrowserType.DEFAULT, headless=True, share_browser=True)
+    await _stagger_launch()
+    async with Browser(config) as browser:
+        yield browser
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_stealth_browser():
+    """A headless STEALTH-mode (Chrome channel) browser process shared across the session."""
+    config = BrowserConfig(type=BrowserType.STEALTH, headless=True, share_browser=True)
+    await _stagger_launch()
+    async with Browser(config) as browser:
+        yield browser
@@ -1,17 +1,31 @@
 """Tests for Browser class — DEFAULT, STEALTH, and CDP modes."""
 
+import asyncio
+import dataclasses
 from unittest.mock import AsyncMock, MagicMock, patch
+from weakref import WeakKeyDictionary
 
 import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from pwbase import Browser, BrowserConfig, BrowserType
 
-pytestmark = pytest.mark.asyncio
-
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 
+@pytest.fixture(autouse=True)
+def _isolated_registry():
+    """Give each test its own shared-browser registry.
+
+    The tests run on the session event loop, whose registry also holds the
+    real browsers from conftest.py; a mock test that fails before stop()
+    must not leave its mock browser behind for them (or reuse theirs).
+    """
+    with patch("pwbase.browser._REGISTRIES", WeakKeyDictionary()):
+        yield
+
+
 def make_browser(browser_type: BrowserType, **kwargs) -> Browser:
     """Create a Browser instance with the given type and optional config kwargs."""
     return Browser(BrowserConfig(type=browser_type, **kwargs))
@@ -113,6 +127,53 @@ class TestDefaultBrowser:
                     args=browser.config.args,
                 )
 
+    async def test_stop_tears_down_in_reverse_order(
+        self, mock_async_playwright, mock_playwright, mock_browser, mock_context
+    ):
+        """stop() closes the context, then the browser, then Playwright."""
+        order = []
+        mock_context.close.side_effect = lambda: order.append("context")
+        mock_browser.close.side_effect = lambda: order.append("browser")
+        mock_playwright.stop.side_effect = lambda: order.append("playwright")
+        with patch(
+            "pwbase.browser.async_playwright", return_value=mock_async_playwright
+        ):
+            async with make_browser(BrowserType.DEFAULT):
+                pass
+
+        assert order == ["context", "browser", "playwright"]
+
+    async def test_failed_start_unwinds(
+        self, mock_async_playwright, mock_playwright, mock_browser
+    ):
+        """A failure mid-start closes what was already opened and resets state."""
+        mock_browser.new_context.side_effect = RuntimeError("boom")
+        with patch(
+            "pwbase.browser.async_playwright", return_value=mock_async_playwright
+        ):
+            browser = make_browser(BrowserType.DEFAULT)
+            with pytest.raises(RuntimeError, match="boom"):
+                await browser.start()
+
+        mock_browser.close.assert_called_once()
+        mock_playwright.stop.assert_called_once()
+        assert browser._exit_stack is None  # pylint: disable=protected-access
+        assert browser._browser is None  # pylint: disable=protected-access
+
+    async def test_start_uses_subclass_launcher(self):
+        """start() dispatches to the launcher as overridden on the subclass."""
+
+        class CustomBrowser(Browser):
+            launched = False
+
+            async def _launch_default(self, exit_stack):
+                self.launched = True
+
+        browser = CustomBrowser(BrowserConfig(type=BrowserType.DEFAULT))
+        await browser.start()
+        assert browser.launched
+        await browser.stop()
+
 
 # ── STEALTH ──────────────────────────────────────────────────────────────────
 
@@ -178,7 +239,7 @@ class TestCdpBrowser:
         ):
             async with make_browser(BrowserType.CDP) as browser:
                 mock_playwright.chromium.connect_over_cdp.assert_called_once_with(
-                    "http://localhost:9222"
+                    "http://localhost:9222", timeout=15000
                 )
                 assert browser.context is not None
 
@@ -191,9 +252,80 @@ class TestCdpBrowser:
                 BrowserType.CDP, cdp_url="http://localhost:9333"
             ) as _:
                 mock_playwright.chromium.connect_over_cdp.assert_called_once_with(
-                    "http://localhost:9333"
+                    "http://localhost:9333", timeout=15000
                 )
 
+    async def test_connect_timeout(self, mock_async_playwright, mock_playwright):
+        """An unreachable CDP endpoint raises TimeoutError and stops Playwright."""
+        mock_playwright.chromium.connect_over_cdp = AsyncMock(
+            side_effect=PlaywrightTimeoutError("Timeout 1000ms exceeded.")
+        )
+        with patch(
+            "pwbase.browser.async_playwright", return_value=mock_async_playwright
+        ):
+            browser = make_browser(BrowserType.CDP, cdp_connect_timeout=1)
+            with pytest.raises(TimeoutError, match="Timed out after 1s"):
+                await browser.start()
+            mock_playwright.chromium.connect_over_cdp.assert_called_once_with(
+                "http://localhost:9222", timeout=1000
+            )
+            mock_playwright.stop.assert_called_once()
+
+    async def test_keepalive_cancelled_on_stop(self, mock_async_playwright):
+        """The CDP keep-alive task runs while connected and is cancelled by stop()."""
+        with patch(
+            "pwbase.browser.async_playwright", return_value=mock_async_playwright
+        ):
+            browser = make_browser(BrowserType.CDP)
+            await browser.start()
+            task = browser._keepalive_task  # pylint: disable=protected-access
+            assert task is not None and not task.done()
+            await browser.stop()
+            assert task.cancelled()
+            assert browser._keepalive_task is None  # pylint: disable=protected-access
+
+    async def test_keepalive_pings_every_interval(
+        self, mock_async_playwright, mock_browser
+    ):
+        """The keep-alive loop sends Browser.getVersion once per cdp_keepalive_interval."""
+        real_sleep = asyncio.sleep
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            await real_sleep(0)
+
+        session = mock_browser.new_browser_cdp_session.return_value
+        with (
+            patch(
+                "pwbase.browser.async_playwright", return_value=mock_async_playwright
+            ),
+            patch("pwbase.browser.asyncio.sleep", fake_sleep),
+        ):
+            async with make_browser(BrowserType.CDP, cdp_keepalive_interval=7.5):
+                while session.send.await_count < 3:
+                    await real_sleep(0)
+                session.send.assert_awaited_with("Browser.getVersion")
+                assert set(delays) == {7.5}
+                assert len(delays) >= session.send.await_count
+
+    async def test_keepalive_stops_on_error(self, mock_async_playwright, mock_browser):
+        """A failing keep-alive ping ends the loop quietly without affecting stop()."""
+        session = mock_browser.new_browser_cdp_session.return_value
+        session.send.side_effect = [None, ConnectionError("socket closed")]
+        with patch(
+            "pwbase.browser.async_playwright", return_value=mock_async_playwright
+        ):
+            browser = make_browser(BrowserType.CDP, cdp_keepalive_interval=0.001)
+            await browser.start()
+            task = browser._keepalive_task  # pylint: disable=protected-access
+            assert task is not None
+            await asyncio.wait_for(task, 1)
+            assert task.exception() is None
+            assert session.send.await_count == 2
+            await browser.stop()
+            mock_browser.close.assert_called_once()
+
     async def test_save_state_raises(self, mock_async_playwright):
         """save_state raises RuntimeError because state persistence is not supported in CDP mode."""
         with patch(
@@ -213,3 +345,127 @@ class TestCdpBrowser:
             async with make_browser(BrowserType.CDP):
                 pass
             mock_context.close.assert_not_called()
+
+
+# ── Shared browser ────────────────────────────────────────────────────────────
+
+
+class TestSharedBrowser:
+    """Tests for Browser instances sharing one Chromium process via share_browser."""
+
+    async def test_launches_once_for_same_key(
+        self, mock_async_playwright, mock_playwright, mock_browser
+    ):
+        """Two sharing browsers launch Chromium once and each open their own context."""
+        with patch(
+            "pwbase.browser.async_playwright", return_value=mock_async_playwright
+        ):
+            async with make_browser(BrowserType.DEFAULT, share_browser=True) as b1:
+                async with make_browser(BrowserType.DEFAULT, share_browser=True) as b2:
+                    assert b1._browser is b2._browser  # pylint: disable=protected-access
+                    mock_playwright.chromium.launch.assert_called_once()
+                    assert mock_browser.new_context.call_count == 2
+
+    async def test_closed_after_last_release(
+        self, mock_async_playwright, mock_playwright, mock_browser
+    ):
+        """The shared browser stays open until the last sharing Browser stops."""
+        with patch(
+            "pwbase.browser.async_playwright", return_value=mock_async_playwright
+        ):
+            b1 = make_browser(BrowserType.DEFAULT, share_browser=True)
+            b2 = make_browser(BrowserType.DEFAULT, share_browser=True)
+            await b1.start()
+            await b2.start()
+
+            await b1.stop()
+            mock_browser.close.assert_not_called()
+
+            await b2.stop()
+            mock_browser.close.assert_called_once()
+            mock_playwright.stop.assert_called_once()
+
+    async def test_different_keys_launch_separately(
+        self, mock_async_playwright, mock_playwright
+    ):
+        """Browsers with different launch options do not share a process."""
+        with patch(
+            "pwbase.browser.async_playwright", return_value=mock_async_playwright
+        ):
+            async with make_browser(BrowserType.DEFAULT, share_browser=True):
+                async with make_browser(
+                    BrowserType.DEFAULT, share_browser=True, headless=False
+                ):
+                    assert mock_playwright.chromium.launch.call_count == 2
+
+    async def test_warm_pool_precreates_contexts(
+        self, mock_async_playwright, mock_browser
+    ):
+        """With warm_pool_size, later starts pop a pre-created context."""
+        mock_browser.new_context = AsyncMock(side_effect=lambda **_: AsyncMock())
+        with patch(
+            "pwbase.browser.async_playwright", return_value=mock_async_playwright
+        ):
+            async with make_browser(
+                BrowserType.DEFAULT, share_browser=True, warm_pool_size=2
+            ):
+                await asyncio.sleep(0)
+                assert mock_browser.new_context.call_count == 3
+
+                b2 = make_browser(
+                    BrowserType.DEFAULT, share_browser=True, warm_pool_size=2
+                )
+                await b2.start()
+                assert mock_browser.new_context.call_count == 3
+                await b2.stop()
+
+    async def test_warm_pool_per_size(self, mock_async_playwright, mock_browser):
+        """Browsers with different warm_pool_size values each get their own pool."""
+        mock_browser.new_context = AsyncMock(side_effect=lambda **_: AsyncMock())
+        with patch(
+            "pwbase.browser.async_playwright", return_value=mock_async_playwright
+        ):
+            async with make_browser(
+                BrowserType.DEFAULT, share_browser=True, warm_pool_size=1
+            ):
+                await asyncio.sleep(0)
+                assert mock_browser.new_context.call_count == 2
+
+                async with make_browser(
+                    BrowserType.DEFAULT, share_browser=True, warm_pool_size=3
+                ):
+                    await asyncio.sleep(0)
+                    assert mock_browser.new_context.call_count == 6
+
+    async def test_warm_pool_skipped_with_stored_state(
+        self, mock_async_playwright, mock_browser, tmp_path
+    ):
+        """Browsers loading stored state never get a pre-created context."""
+        state = tmp_path / "state.json"
+        state.write_text("{}", encoding="utf-8")
+        mock_browser.new_context = AsyncMock(side_effect=lambda **_: AsyncMock())
+        with patch(
+            "pwbase.browser.async_playwright", return_value=mock_async_playwright
+        ):
+            async with make_browser(
+                BrowserType.DEFAULT,
+                share_browser=True,
+                warm_pool_size=2,
+                state_path=state,
+            ):
+                await asyncio.sleep(0)
+                assert mock_browser.new_context.call_count == 1
+                _, kwargs = mock_browser.new_context.call_args
+                assert kwargs["storage_state"] == str(state)
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+
+def test_config_is_frozen_and_hashable():
+    """BrowserConfig stores list args as a tuple so equal configs hash equally."""
+    config = BrowserConfig(args=["--no-sandbox"])
+    assert config.args == ("--no-sandbox",)
+    assert hash(config) == hash(BrowserConfig(args=("--no-sandbox",)))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.headless = False  # type: ignore[misc]
@@ -7,14 +7,15 @@ Split into two groups:
 
 * ``TestBrowserHarExtractorReal`` — launches a real headless Chromium instance
   and asserts that a valid HAR file is written to disk after the context exits.
-  ``page.route()`` serves controlled responses so no external network access
-  is required.
+  One ``page.route()`` handler serves controlled responses so no external
+  network access is required.
 """
 
 import json
 import re
 from pathlib import Path
 from unittest.mock import patch
+from urllib.parse import urlsplit
 
 import pytest
 
@@ -31,18 +32,28 @@ def _extractor(tmp_path: Path, **kwargs) -> BrowserHarExtractor:
     )
 
 
-async def _route_json(route, body: dict) -> None:
-    await route.fulfill(
-        status=200,
-        headers={"content-type": "application/json"},
-        body=json.dumps(body),
-    )
+_ORIGIN = "https://test.internal"
+
+# Path -> encoded JSON body served under ``_ORIGIN``.
+_BODIES: dict[str, bytes] = {
+    "/api/data": b'{"hello": "world"}',
+    "/api/items": b'{"items": []}',
+}
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+async def _dispatch(route) -> None:
+    """Fulfil a ``_ORIGIN`` request from ``_BODIES``, or with a 404 for any other path."""
+    body = _BODIES.get(urlsplit(route.request.url).path)
+    if body is None:
+        await route.fulfill(status=404)
+    else:
+        await route.fulfill(status=200, headers=_JSON_HEADERS, body=body)
 
 
 # ── Unit tests ────────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 class TestBrowserHarExtractorUnit:
     """Init and guard tests that do not require a live browser."""
 
@@ -152,7 +163,7 @@ class TestBrowserHarExtractorUnit:
 # ── Real browser tests ────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
+@pytest.mark.slow
 class TestBrowserHarExtractorReal:
     """End-to-end tests with a live headless Chromium browser.
 
@@ -165,10 +176,7 @@ class TestBrowserHarExtractorReal:
         har = tmp_path / "session.har"
         async with _extractor(tmp_path, har_path=har) as browser:
             page = await browser.get_page()
-            await page.route(
-                "https://test.internal/api/data",
-                lambda route: _route_json(route, {"hello": "world"}),
-            )
+            await page.route(f"{_ORIGIN}/**", _dispatch)
             await page.goto("https://test.internal/api/data")
 
         assert har.exists()
@@ -179,10 +187,7 @@ class TestBrowserHarExtractorReal:
         har = tmp_path / "session.har"
         async with _extractor(tmp_path, har_path=har) as browser:
             page = await browser.get_page()
-            await page.route(
-                "https://test.internal/api/data",
-                lambda route: _route_json(route, {"ping": "pong"}),
-            )
+            await page.route(f"{_ORIGIN}/**", _dispatch)
             await page.goto("https://test.internal/api/data")
 
         with har.open("r", encoding="utf-8") as file:
@@ -197,10 +202,7 @@ class TestBrowserHarExtractorReal:
         target = "https://test.internal/api/items"
         async with _extractor(tmp_path, har_path=har) as browser:
             page = await browser.get_page()
-            await page.route(
-                target,
-                lambda route: _route_json(route, {"items": []}),
-            )
+            await page.route(f"{_ORIGIN}/**", _dispatch)
             await page.goto(target)
 
         with har.open("r", encoding="utf-8") as file:
@@ -218,10 +220,7 @@ class TestBrowserHarExtractorReal:
             har_url_filter="**/api/**",
         ) as browser:
             page = await browser.get_page()
-            await page.route(
-                "https://test.internal/api/data",
-                lambda route: _route_json(route, {"filtered": True}),
-            )
+            await page.route(f"{_ORIGIN}/**", _dispatch)
             await page.goto("https://test.internal/api/data")
 
         with har.open("r", encoding="utf-8") as file:
@@ -236,10 +235,7 @@ class TestBrowserHarExtractorReal:
         har = tmp_path / "session.har"
         async with _extractor(tmp_path, har_path=har) as browser:
             page = await browser.get_page()
-            await page.route(
-                "https://test.internal/api/data",
-                lambda route: _route_json(route, {}),
-            )
+            await page.route(f"{_ORIGIN}/**", _dispatch)
             await page.goto("https://test.internal/api/data")
             # HAR is flushed only on context close, not during navigation
             size_during = har.stat().st_size if har.exists() else 0
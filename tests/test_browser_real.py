@@ -6,61 +6,152 @@ All browsers run headless so the suite is CI-friendly.
 Skip markers
 ------------
 - Tests in ``TestStealthBrowserReal`` require Google Chrome to be installed
-  (BrowserConfig defaults to channel="chrome" for STEALTH mode).  If Chrome
-  is not present they will fail with a clear Playwright error.
+  (BrowserConfig defaults to channel="chrome" for STEALTH mode).  They are
+  skipped as a class when Chrome is not found in its standard locations.
 - Tests in ``TestCdpBrowserReal`` that require a live CDP endpoint are skipped
   automatically unless the environment has one running on localhost:9222.
+
+Shared processes
+----------------
+The DEFAULT and STEALTH helpers set ``share_browser=True`` and the classes use
+the session-scoped ``shared_*_browser`` fixtures from ``conftest.py``, so each
+mode launches Chromium once per session and every test gets a fresh context.
+All tests run on the session event loop, which the shared browsers are bound to.
+Tests of the wrapper's own start/stop invariants pass ``share_browser=False``
+so they exercise a dedicated process.
 """
 
 import json
+import os
+import select
+import shutil
 import socket
+import sys
+from dataclasses import replace
+from functools import cache
+from pathlib import Path
 
 import pytest
 from playwright.async_api import BrowserContext, Page
 
 from pwbase import Browser, BrowserConfig, BrowserType
 
-pytestmark = pytest.mark.asyncio
-
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 
-def _default(**kwargs) -> Browser:
-    return Browser(BrowserConfig(type=BrowserType.DEFAULT, headless=True, **kwargs))
+_DEFAULT_CONFIG = BrowserConfig(
+    type=BrowserType.DEFAULT, headless=True, share_browser=True
+)
+_STEALTH_CONFIG = BrowserConfig(
+    type=BrowserType.STEALTH, headless=True, share_browser=True
+)
 
 
-def _stealth(**kwargs) -> Browser:
-    return Browser(BrowserConfig(type=BrowserType.STEALTH, headless=True, **kwargs))
+def _default(**kwargs) -> Browser:
+    return Browser(replace(_DEFAULT_CONFIG, **kwargs) if kwargs else _DEFAULT_CONFIG)
 
 
+def _stealth(**kwargs) -> Browser:
+    return Browser(replace(_STEALTH_CONFIG, **kwargs) if kwargs else _STEALTH_CONFIG)
+
+
+@cache
+def _chrome_available() -> bool:
+    """Return True when Google Chrome (Playwright's ``chrome`` channel) is installed."""
+    names = ("google-chrome", "google-chrome-stable", "chrome")
+    if any(shutil.which(name) for name in names):
+        return True
+    if sys.platform == "darwin":
+        candidates = [
+            Path("/Applications/Google Chrome.app/Contents/MacOS/Google Chrome")
+        ]
+    elif sys.platform == "win32":
+        candidates = [
+            Path(os.environ[var]) / "Google/Chrome/Application/chrome.exe"
+            for var in ("PROGRAMFILES", "PROGRAMFILES(X86)", "LOCALAPPDATA")
+            if var in os.environ
+        ]
+    else:
+        candidates = [Path("/opt/google/chrome/chrome")]
+    return any(path.exists() for path in candidates)
+
+
+@cache
 def _cdp_available() -> bool:
     """Return True only when a CDP endpoint is reachable on localhost:9222."""
-    try:
-        with socket.create_connection(("localhost", 9222), timeout=1):
-            return True
-    except OSError:
-        return False
+    # Chrome binds its debugging port to 127.0.0.1, so connect there directly
+    # rather than resolving "localhost" (and possibly stalling on ::1 first).
+    # A closed local port is refused immediately; the select() timeout only
+    # bounds the probe if something silently drops the connection.
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setblocking(False)
+        sock.connect_ex(("127.0.0.1", 9222))
+        _, writable, _ = select.select([], [sock], [], 0.05)
+        return bool(writable) and not sock.getsockopt(
+            socket.SOL_SOCKET, socket.SO_ERROR
+        )
+
+
+# ── Unstarted ─────────────────────────────────────────────────────────────────
+
+
+class TestUnstartedBrowserReal:
+    """Guards that fire before any browser is launched."""
+
+    async def test_get_page_not_started_raises(self):
+        """get_page() raises RuntimeError when the browser has not been started."""
+        browser = _default()
+        with pytest.raises(RuntimeError, match="Browser not started"):
+            await browser.get_page()
+
+    async def test_stop_before_start_is_safe(self):
+        """Calling stop() on a never-started browser does not raise."""
+        browser = _default()
+        await browser.stop()  # must not raise
+
+    async def test_save_state_not_started_raises(self):
+        """save_state() raises RuntimeError before the browser is started."""
+        browser = _default()
+        with pytest.raises(RuntimeError, match="Browser not started"):
+            await browser.save_state()
 
 
 # ── DEFAULT mode ──────────────────────────────────────────────────────────────
 
 
+_NEEDS_CHROME = pytest.mark.skipif(
+    not _chrome_available(), reason="Google Chrome is not installed"
+)
+
+
+@pytest.fixture(params=["default", pytest.param("stealth", marks=_NEEDS_CHROME)])
+def factory(request):
+    """Browser builder for each mode, with that mode's shared browser running."""
+    request.getfixturevalue(f"shared_{request.param}_browser")
+    return {"default": _default, "stealth": _stealth}[request.param]
+
+
+@pytest.mark.slow
+@pytest.mark.usefixtures("shared_default_browser")
 class TestDefaultBrowserReal:
-    """Real Playwright tests for Browser in DEFAULT mode."""
+    """Real Playwright tests for Browser in DEFAULT mode.
 
-    async def test_start_creates_context(self):
-        """start() sets context to a live BrowserContext."""
-        browser = _default()
+    Tests taking ``factory`` also run in STEALTH mode.
+    """
+
+    async def test_start_creates_context(self, factory):
+        """start() on a dedicated (unshared) browser sets a live BrowserContext."""
+        browser = factory(share_browser=False)
         try:
             await browser.start()
             assert isinstance(browser.context, BrowserContext)
         finally:
             await browser.stop()
 
-    async def test_stop_clears_internal_state(self):
+    async def test_stop_clears_internal_state(self, factory):
         """After stop(), all internal references are reset to None."""
-        browser = _default()
+        browser = factory()
         await browser.start()
         await browser.stop()
 
@@ -69,16 +160,16 @@ class TestDefaultBrowserReal:
         assert browser.context is None
         assert browser._exit_stack is None
 
-    async def test_context_manager_starts_and_stops(self):
+    async def test_context_manager_starts_and_stops(self, factory):
         """Async context manager starts the browser on entry and cleans up on exit."""
-        async with _default() as browser:
+        async with factory() as browser:
             assert isinstance(browser.context, BrowserContext)
 
         assert browser.context is None
 
     async def test_double_start_raises(self):
         """Starting an already-started browser raises RuntimeError."""
-        browser = _default()
+        browser = _default(share_browser=False)
         await browser.start()
         try:
             with pytest.raises(RuntimeError, match="already started"):
@@ -99,53 +190,35 @@ class TestDefaultBrowserReal:
             p2 = await browser.get_page(0)
             assert p1 is p2
 
-    async def test_get_page_not_started_raises(self):
-        """get_page() raises RuntimeError when the browser has not been started."""
-        browser = _default()
-        with pytest.raises(RuntimeError, match="Browser not started"):
-            await browser.get_page()
-
-    async def test_stop_before_start_is_safe(self):
-        """Calling stop() on a never-started browser does not raise."""
-        browser = _default()
-        await browser.stop()  # must not raise
-
     async def test_stop_twice_is_idempotent(self):
         """Calling stop() a second time after a clean shutdown does not raise."""
-        browser = _default()
+        browser = _default(share_browser=False)
         await browser.start()
         await browser.stop()
         await browser.stop()  # second call must be a no-op
 
-    async def test_save_state_writes_valid_json(self, tmp_path):
-        """save_state() writes a Playwright storage-state JSON file."""
-        state_file = tmp_path / "state.json"
-        async with _default(state_path=state_file) as browser:
-            await browser.save_state()
-
-        assert state_file.exists()
-        data = json.loads(state_file.read_text())
-        assert "cookies" in data
-        assert "origins" in data
-
-    async def test_save_state_path_arg_overrides_config(self, tmp_path):
-        """A path argument passed to save_state() takes precedence over config.state_path."""
+    async def test_save_state_variants(self, tmp_path):
+        """save_state() writes storage-state JSON to config.state_path, an explicit
+        path (which takes precedence) and a path with missing parent directories."""
         config_path = tmp_path / "config_state.json"
         override_path = tmp_path / "override_state.json"
+        nested_path = tmp_path / "a" / "b" / "state.json"
 
         async with _default(state_path=config_path) as browser:
             await browser.save_state(path=override_path)
+            assert override_path.exists()
+            assert not config_path.exists()
 
-        assert override_path.exists()
-        assert not config_path.exists()
+            await browser.save_state()
+            assert config_path.exists()
 
-    async def test_save_state_creates_parent_dirs(self, tmp_path):
-        """save_state() creates missing parent directories automatically."""
-        nested = tmp_path / "a" / "b" / "state.json"
-        async with _default() as browser:
-            await browser.save_state(path=nested)
+            await browser.save_state(path=nested_path)
+            assert nested_path.exists()
 
-        assert nested.exists()
+        with config_path.open("r", encoding="utf-8") as file:
+            data = json.load(file)
+        assert "cookies" in data
+        assert "origins" in data
 
     async def test_save_state_no_path_raises(self):
         """save_state() raises ValueError when no path is configured or passed."""
@@ -153,12 +226,6 @@ class TestDefaultBrowserReal:
             with pytest.raises(ValueError, match="No state path provided"):
                 await browser.save_state()
 
-    async def test_save_state_not_started_raises(self):
-        """save_state() raises RuntimeError before the browser is started."""
-        browser = _default()
-        with pytest.raises(RuntimeError, match="Browser not started"):
-            await browser.save_state()
-
     async def test_missing_state_path_starts_cleanly(self, tmp_path):
         """Browser starts without error when state_path points to a nonexistent file."""
         missing = tmp_path / "does_not_exist.json"
@@ -167,10 +234,7 @@ class TestDefaultBrowserReal:
 
     async def test_custom_viewport_applied(self):
         """Configured viewport dimensions are reflected on the opened page."""
-        config = BrowserConfig(
-            type=BrowserType.DEFAULT, headless=True, viewport=(800, 600)
-        )
-        async with Browser(config) as browser:
+        async with _default(viewport=(800, 600)) as browser:
             page = await browser.get_page()
             assert page.viewport_size == {"width": 800, "height": 600}
 
@@ -178,39 +242,15 @@ class TestDefaultBrowserReal:
 # ── STEALTH mode ──────────────────────────────────────────────────────────────
 
 
+@pytest.mark.slow
+@_NEEDS_CHROME
+@pytest.mark.usefixtures("shared_stealth_browser")
 class TestStealthBrowserReal:
     """Real Playwright tests for Browser in STEALTH mode.
 
     Requires Google Chrome (channel='chrome') to be installed.
     """
 
-    async def test_start_creates_context(self):
-        """Stealth browser start() yields a live BrowserContext."""
-        browser = _stealth()
-        try:
-            await browser.start()
-            assert isinstance(browser.context, BrowserContext)
-        finally:
-            await browser.stop()
-
-    async def test_stop_clears_internal_state(self):
-        """After stopping, all internal references are reset."""
-        browser = _stealth()
-        await browser.start()
-        await browser.stop()
-
-        assert browser._browser is None
-        assert browser._playwright is None
-        assert browser.context is None
-        assert browser._exit_stack is None
-
-    async def test_context_manager(self):
-        """Stealth browser works correctly as an async context manager."""
-        async with _stealth() as browser:
-            assert isinstance(browser.context, BrowserContext)
-
-        assert browser.context is None
-
     async def test_get_page_returns_real_page(self):
         """get_page() returns a live Page in STEALTH mode."""
         async with _stealth() as browser:
@@ -221,6 +261,7 @@ class TestStealthBrowserReal:
 # ── CDP mode ──────────────────────────────────────────────────────────────────
 
 
+@pytest.mark.slow
 class TestCdpBrowserReal:
     """Tests for Browser in CDP mode.
 
@@ -248,11 +289,14 @@ class TestCdpBrowserReal:
     )
     async def test_cdp_context_not_closed_on_stop(self):
         """Stop() must not close the borrowed CDP context."""
-        browser = Browser(BrowserConfig(type=BrowserType.CDP))
-        await browser.start()
-        ctx = browser.context
-        assert ctx is not None
-        await browser.stop()
-        # If pwbase had called context.close(), accessing .pages would raise.
-        # This verifies the borrowed context is still live after stop().
-        _ = ctx.pages
+        marker = "about:blank#pwbase-cdp-probe"
+        async with Browser(BrowserConfig(type=BrowserType.CDP)) as browser:
+            page = await browser.get_page(len(browser.context.pages))
+            await page.goto(marker)
+        # After stop() this connection is gone, so the context can only be
+        # checked from a fresh one: closing it would have closed the page too.
+        async with Browser(BrowserConfig(type=BrowserType.CDP)) as browser:
+            probes = [p for p in browser.context.pages if p.url == marker]
+            assert probes
+            for probe in probes:
+                await probe.close()
@@ -1,6 +1,9 @@
 """Tests for BrowserSessionExtractor."""
 
+import asyncio
+import dataclasses
 import json
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,8 +13,6 @@ from pwbase.browser_session_extractor import (
     AllRequestExtractor,
 )
 
-pytestmark = pytest.mark.asyncio
-
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
@@ -21,44 +22,78 @@ def make_extractor(**kwargs) -> BrowserSessionExtractor:
     return BrowserSessionExtractor(BrowserConfig(type=BrowserType.DEFAULT, **kwargs))
 
 
+# Shared by every make_captured_response() result; tests must not mutate its
+# containers.  They stay a plain dict / list because to_session() checks that.
+_DEFAULT_CAPTURED = CapturedResponse(
+    url="https://example.com/api/data",
+    method="GET",
+    headers={"content-type": "application/json"},
+    body={"key": "value"},
+    request_headers={"authorization": "Bearer token", ":method": "GET"},
+    request_post_data=None,
+    cookies=[
+        {
+            "name": "session",
+            "value": "abc123",
+            "domain": ".example.com",
+            "path": "/",
+        }
+    ],
+)
+
+
 def make_captured_response(**kwargs) -> CapturedResponse:
     """Create a CapturedResponse with defaults for test assertions."""
-    defaults = dict(
-        url="https://example.com/api/data",
-        method="GET",
-        headers={"content-type": "application/json"},
-        body={"key": "value"},
-        request_headers={"authorization": "Bearer token", ":method": "GET"},
-        request_post_data=None,
-        cookies=[
-            {
-                "name": "session",
-                "value": "abc123",
-                "domain": ".example.com",
-                "path": "/",
-            }
-        ],
+    return dataclasses.replace(_DEFAULT_CAPTURED, **kwargs)
+
+
+def _returning(value):
+    """Return an async function that returns ``value``.
+
+    Tests that assert on calls replace the attribute with an ``AsyncMock``.
+    """
+
+    async def call():
+        return value
+
+    return call
+
+
+def _mock_request(method: str = "GET") -> SimpleNamespace:
+    """Build a stand-in Playwright Request."""
+    return SimpleNamespace(
+        method=method,
+        post_data=None,
+        headers={"authorization": "Bearer token"},
+        all_headers=_returning(
+            {"authorization": "Bearer token", "cookie": "session=abc123"}
+        ),
     )
-    return CapturedResponse(**{**defaults, **kwargs})
+
+
+# A body that is not valid JSON, for the decode-failure paths.
+_INVALID_JSON = b"not valid json {{{"
 
 
 def make_mock_response(
-    url: str, json_body: dict | None = None, content_type: str = "application/json"
-) -> AsyncMock:
-    """Build a mock Playwright Response object."""
-    body_data = json_body or {"data": "value"}
-    response = AsyncMock()
-    response.url = url
-    response.headers = {"content-type": content_type}
-    response.body = AsyncMock(return_value=json.dumps(body_data).encode())
-    response.all_headers = AsyncMock(return_value={"content-type": content_type})
-    response.request = MagicMock()
-    response.request.method = "GET"
-    response.request.post_data = None
-    response.request.all_headers = AsyncMock(
-        return_value={"authorization": "Bearer token"}
+    url: str,
+    json_body: dict | None = None,
+    content_type: str = "application/json",
+    body: bytes | None = None,
+) -> SimpleNamespace:
+    """Build a stand-in Playwright Response.
+
+    ``body`` overrides the raw bytes otherwise encoded from ``json_body``.
+    """
+    if body is None:
+        body = json.dumps(json_body or {"data": "value"}).encode()
+    return SimpleNamespace(
+        url=url,
+        headers={"content-type": content_type},
+        body=_returning(body),
+        all_headers=_returning({"content-type": content_type}),
+        request=_mock_request(),
     )
-    return response
 
 
 def make_all_mock_response(
@@ -66,24 +101,27 @@ def make_all_mock_response(
     method: str = "GET",
     content_type: str = "application/json",
     body: bytes | None = None,
-) -> AsyncMock:
-    """Build a mock Playwright Response for AllRequestExtractor tests."""
+) -> SimpleNamespace:
+    """Build a stand-in Playwright Response for AllRequestExtractor tests."""
     if body is None:
         if "application/json" in content_type:
             body = json.dumps({"data": "value"}).encode()
         else:
             body = b"body content"
-    response = AsyncMock()
-    response.url = url
-    response.headers = {"content-type": content_type}
-    response.body = AsyncMock(return_value=body)
-    response.all_headers = AsyncMock(return_value={"content-type": content_type})
-    response.request.method = method
-    response.request.post_data = None
-    response.request.all_headers = AsyncMock(
-        return_value={"authorization": "Bearer token"}
+    return SimpleNamespace(
+        url=url,
+        headers={"content-type": content_type},
+        body=_returning(body),
+        all_headers=_returning({"content-type": content_type}),
+        request=_mock_request(method),
     )
-    return response
+
+
+@pytest.fixture(autouse=True)
+def _patch_playwright(mock_async_playwright):
+    """Route every Browser.start() in this module to the mock Playwright."""
+    with patch("pwbase.browser.async_playwright", return_value=mock_async_playwright):
+        yield
 
 
 def make_all_extractor(**kwargs) -> AllRequestExtractor:
@@ -97,86 +135,249 @@ def make_all_extractor(**kwargs) -> AllRequestExtractor:
 class TestRecording:
     """Tests for recording lifecycle methods."""
 
-    async def test_start_recording_clears_responses(
-        self, mock_async_playwright, mock_page
-    ):
+    async def test_start_recording_clears_responses(self, mock_page):
         """Verify start_recording resets any previously captured responses."""
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                browser.responses = [make_captured_response()]
-                await browser.start_recording(mock_page)
-                assert browser.responses == []
-
-    async def test_start_recording_attaches_listener(
-        self, mock_async_playwright, mock_page
-    ):
-        """Verify start_recording registers the response handler on the page."""
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                await browser.start_recording(mock_page)
-                mock_page.on.assert_called_once_with(
-                    "response",
-                    browser._handle_response,  # type: ignore[reportPrivateUsage]  # pylint: disable=protected-access
-                )
+        async with make_extractor() as browser:
+            browser.responses = [make_captured_response()]
+            await browser.start_recording(mock_page)
+            assert browser.responses == []
 
-    async def test_stop_recording_removes_listener(
-        self, mock_async_playwright, mock_page
-    ):
+    async def test_start_recording_attaches_listener(self, mock_page):
+        """Verify start_recording registers the response handler on the page."""
+        async with make_extractor() as browser:
+            await browser.start_recording(mock_page)
+            mock_page.on.assert_called_once_with(
+                "response",
+                browser._handle_response,  # type: ignore[reportPrivateUsage]  # pylint: disable=protected-access
+            )
+
+    async def test_stop_recording_removes_listener(self, mock_page):
         """Verify stop_recording detaches the listener and clears the page reference."""
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                await browser.start_recording(mock_page)
-                browser.stop_recording()
-                mock_page.remove_listener.assert_called_once_with(
-                    "response",
-                    browser._handle_response,  # type: ignore[reportPrivateUsage]  # pylint: disable=protected-access
-                )
-                assert browser._page is None  # pylint: disable=protected-access
-
-    async def test_handle_response_captures_json(
-        self, mock_async_playwright, mock_context
-    ):
+        async with make_extractor() as browser:
+            await browser.start_recording(mock_page)
+            browser.stop_recording()
+            mock_page.remove_listener.assert_called_once_with(
+                "response",
+                browser._handle_response,  # type: ignore[reportPrivateUsage]  # pylint: disable=protected-access
+            )
+            assert browser._page is None  # pylint: disable=protected-access
+
+    async def test_handle_response_captures_json(self):
         """Verify JSON responses are captured and stored."""
         mock_response = make_mock_response("https://example.com/api/data")
-        mock_context.cookies = AsyncMock(return_value=[])
-
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 1
-                assert browser.responses[0].url == "https://example.com/api/data"
+        async with make_extractor() as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 1
+            assert browser.responses[0].url == "https://example.com/api/data"
 
-    async def test_handle_response_ignores_non_json(self, mock_async_playwright):
+    async def test_handle_response_ignores_non_json(self):
         """Verify non-JSON responses (e.g. images) are not captured."""
         mock_response = make_mock_response(
             "https://example.com/image.png", content_type="image/png"
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 0
-
-    async def test_handle_response_ignores_invalid_json(self, mock_async_playwright):
+        async with make_extractor() as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 0
+
+    async def test_handle_response_ignores_invalid_json(self):
         """Verify responses that fail JSON parsing are silently skipped."""
-        mock_response = make_mock_response("https://example.com/api/bad")
-        mock_response.body = AsyncMock(return_value=b"not valid json {{{")
+        mock_response = make_mock_response(
+            "https://example.com/api/bad", body=_INVALID_JSON
+        )
 
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 0
+        async with make_extractor() as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 0
+
+    async def test_handle_response_decodes_non_standard_json(self):
+        """Verify bodies only the stdlib decoder accepts (e.g. NaN) are still captured."""
+        mock_response = make_mock_response(
+            "https://example.com/api/data", body=b'{"v": NaN, "big": 1e400}'
+        )
+        async with make_extractor() as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 1
+            assert browser.responses[0].body["big"] == float("inf")
+
+    async def test_lazy_body_decoded_on_access(self, mock_page):
+        """Verify lazy_body stores raw bytes and decodes them on first access."""
+        mock_response = make_mock_response(
+            "https://example.com/api/data", json_body={"v": 1}
+        )
+        bad_response = make_mock_response(
+            "https://example.com/api/bad", body=_INVALID_JSON
+        )
+        async with make_extractor() as browser:
+            await browser.start_recording(mock_page, lazy_body=True)
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            await browser._handle_response(bad_response)  # pylint: disable=protected-access
+            (good,) = browser.responses
+            assert good._raw_body == b'{"v": 1}'  # pylint: disable=protected-access
+            assert good.body == {"v": 1}
+            assert good._raw_body is None  # pylint: disable=protected-access
+            good.drop_body()
+            assert good.body is None
+
+    @pytest.mark.parametrize("lazy_body", [False, True])
+    async def test_invalid_json_skipped_with_or_without_lazy_body(
+        self, mock_page, lazy_body
+    ):
+        """Verify invalid JSON is skipped the same way whether or not bodies are lazy."""
+        bad_response = make_mock_response(
+            "https://example.com/api/bad", body=_INVALID_JSON
+        )
+        for extractor in (make_extractor(), make_all_extractor()):
+            async with extractor as browser:
+                await browser.start_recording(mock_page, lazy_body=lazy_body)
+                await browser._handle_response(bad_response)  # pylint: disable=protected-access
+                assert list(browser.responses) == []
+
+    def test_lazy_body_written_to_json_file(self, tmp_path):
+        """Verify a lazily decoded body is written decoded, without the raw bytes."""
+        captured = CapturedResponse.with_raw_body(
+            b'{"v": 1}',
+            url="https://example.com/api/data",
+            method="GET",
+            headers={},
+            request_headers={},
+        )
+        path = tmp_path / "captured.json"
+        captured.to_json_file(str(path))
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["body"] == {"v": 1}
+        assert "_raw_body" not in data
+        assert CapturedResponse.from_json_file(str(path)) == captured
+
+    async def test_headers_taken_from_response_event(self, mock_page):
+        """Verify headers come from the response event without extra round-trips."""
+        mock_response = make_mock_response("https://example.com/api/data")
+        mock_response.all_headers = AsyncMock()
+        mock_response.request.all_headers = AsyncMock()
+        async with make_extractor() as browser:
+            await browser.start_recording(mock_page)
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            captured = browser.responses[0]
+            assert captured.request_headers == {"authorization": "Bearer token"}
+            mock_response.all_headers.assert_not_called()
+            mock_response.request.all_headers.assert_not_called()
+
+    async def test_captured_headers_are_interned(self):
+        """Verify repeated header names and short values share one string object."""
+        first = make_mock_response("https://example.com/api/a")
+        second = make_mock_response("https://example.com/api/b")
+        first.headers = {"content-type": "".join(["application/", "json"])}
+        second.headers = {"content-type": "".join(["application/", "json"])}
+        async with make_extractor() as browser:
+            await browser._handle_response(first)  # pylint: disable=protected-access
+            await browser._handle_response(second)  # pylint: disable=protected-access
+            a, b = (r.headers["content-type"] for r in browser.responses)
+            assert a is b
+
+    async def test_capture_all_headers(self, mock_page):
+        """Verify capture_all_headers fetches the complete header sets."""
+        mock_response = make_mock_response("https://example.com/api/data")
+        async with make_extractor() as browser:
+            await browser.start_recording(mock_page, capture_all_headers=True)
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            captured = browser.responses[0]
+            assert captured.request_headers["cookie"] == "session=abc123"
+
+    async def test_cookies_fetched_once_per_burst(self, mock_context):
+        """Verify a burst of responses to one URL shares one cookie fetch."""
+        sid = {"name": "sid", "value": "1", "domain": "example.com", "path": "/"}
+        mock_context.cookies = AsyncMock(return_value=[sid])
+        async with make_extractor() as browser:
+            await asyncio.gather(
+                browser._handle_response(  # pylint: disable=protected-access
+                    make_mock_response("https://example.com/api/data")
+                ),
+                browser._handle_response(  # pylint: disable=protected-access
+                    make_mock_response("https://example.com/api/data")
+                ),
+                browser._handle_response(  # pylint: disable=protected-access
+                    make_mock_response("https://example.com/api/other")
+                ),
+            )
+            assert mock_context.cookies.await_args_list == [
+                (("https://example.com/api/data",),),
+                (("https://example.com/api/other",),),
+            ]
+            assert [r.cookies for r in browser.responses] == [[sid]] * 3
+
+    async def test_cookies_refetched_for_later_response(self, mock_context):
+        """Verify a response arriving after a cookie fetch started sees new cookies."""
+        sid = {"name": "sid", "value": "1", "domain": "example.com", "path": "/"}
+        mock_context.cookies = AsyncMock(side_effect=[[], [sid]])
+        async with make_extractor() as browser:
+            await browser._handle_response(  # pylint: disable=protected-access
+                make_mock_response("https://example.com/api/data")
+            )
+            await browser._handle_response(  # pylint: disable=protected-access
+                make_mock_response("https://example.com/api/login")
+            )
+            assert mock_context.cookies.await_count == 2
+            login = browser.find_response("api/login")
+            assert login is not None
+            assert login.cookies == [sid]
+            assert browser.to_session(login).cookies.get("sid") == "1"
+
+    async def test_cookie_fetch_in_flight_not_shared_with_later_response(
+        self, mock_context
+    ):
+        """Verify a response arriving during a fetch for its URL starts a new fetch."""
+        sid = {"name": "sid", "value": "1", "domain": "example.com", "path": "/"}
+        release = asyncio.Event()
+        results = iter([[], [sid]])
+
+        async def cookies(_url):
+            await release.wait()
+            return next(results)
+
+        mock_context.cookies = AsyncMock(side_effect=cookies)
+        async with make_extractor() as browser:
+            first = asyncio.ensure_future(
+                browser._handle_response(  # pylint: disable=protected-access
+                    make_mock_response("https://example.com/api/data", body=b"[1]")
+                )
+            )
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(
+                browser._handle_response(  # pylint: disable=protected-access
+                    make_mock_response("https://example.com/api/data", body=b"[2]")
+                )
+            )
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(first, second)
+            assert mock_context.cookies.await_count == 2
+            assert [(r.body, r.cookies) for r in browser.responses] == [
+                ([1], []),
+                ([2], [sid]),
+            ]
+
+    async def test_url_filter_skips_before_body_fetch(self, mock_page):
+        """Verify responses rejected by url_filter are skipped without fetching the body."""
+        mock_response = make_mock_response("https://example.com/api/other")
+        mock_response.body = AsyncMock()
+        async with make_extractor() as browser:
+            await browser.start_recording(
+                mock_page, url_filter=lambda url: "api/data" in url
+            )
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 0
+            mock_response.body.assert_not_called()
+
+    async def test_methods_filter(self, mock_page):
+        """Verify only responses to the requested methods are captured."""
+        get_response = make_mock_response("https://example.com/api/data")
+        post_response = make_mock_response("https://example.com/api/data")
+        post_response.request.method = "POST"
+        async with make_extractor() as browser:
+            await browser.start_recording(mock_page, methods=["post"])
+            await browser._handle_response(get_response)  # pylint: disable=protected-access
+            await browser._handle_response(post_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 1
+            assert browser.responses[0].method == "POST"
 
 
 # ── Querying ──────────────────────────────────────────────────────────────────
@@ -185,71 +386,238 @@ class TestRecording:
 class TestQuerying:
     """Tests for response lookup and filtering methods."""
 
-    async def test_find_response_returns_most_recent(self, mock_async_playwright):
+    async def test_find_response_returns_most_recent(self):
         """Verify find_response returns the last captured match for a URL pattern."""
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                browser.responses = [
-                    make_captured_response(
-                        url="https://example.com/api/data", body={"v": 1}
-                    ),
-                    make_captured_response(
-                        url="https://example.com/api/data", body={"v": 2}
-                    ),
-                ]
-                result = browser.find_response("api/data")
-                assert result is not None
-                assert result.body == {"v": 2}
-
-    async def test_find_response_returns_none_if_not_found(self, mock_async_playwright):
+        async with make_extractor() as browser:
+            browser.responses = [
+                make_captured_response(
+                    url="https://example.com/api/data", body={"v": 1}
+                ),
+                make_captured_response(
+                    url="https://example.com/api/data", body={"v": 2}
+                ),
+            ]
+            result = browser.find_response("api/data")
+            assert result is not None
+            assert result.body == {"v": 2}
+
+    async def test_find_response_returns_none_if_not_found(self):
         """Verify find_response returns None when no URL matches the pattern."""
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                result = browser.find_response("api/missing")
-                assert result is None
-
-    async def test_find_all_responses(self, mock_async_playwright):
-        """Verify find_all_responses returns every captured match for a URL pattern."""
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                browser.responses = [
-                    make_captured_response(url="https://example.com/api/data"),
-                    make_captured_response(url="https://example.com/api/other"),
-                    make_captured_response(url="https://example.com/api/data"),
-                ]
-                results = browser.find_all_responses("api/data")
-                assert len(results) == 2
+        async with make_extractor() as browser:
+            result = browser.find_response("api/missing")
+            assert result is None
 
-    async def test_wait_for_response_no_page(self, mock_async_playwright):
+    async def test_find_all_responses(self):
+        """Verify find_all_responses returns every captured match for a URL pattern."""
+        async with make_extractor() as browser:
+            browser.responses = [
+                make_captured_response(url="https://example.com/api/data"),
+                make_captured_response(url="https://example.com/api/other"),
+                make_captured_response(url="https://example.com/api/data"),
+            ]
+            results = browser.find_all_responses("api/data")
+            assert len(results) == 2
+
+    async def test_repeated_lookup_sees_new_responses(self):
+        """Verify a repeated lookup picks up responses captured since the previous one."""
+        async with make_extractor() as browser:
+            browser.responses.append(make_captured_response(body={"v": 1}))
+            assert len(browser.find_all_responses("api/data")) == 1
+
+            browser.responses.append(make_captured_response(body={"v": 2}))
+            result = browser.find_response("api/data")
+            assert result is not None
+            assert result.body == {"v": 2}
+            assert len(browser.find_all_responses("api/data")) == 2
+
+            browser.responses = [make_captured_response(body={"v": 3})]
+            assert [r.body for r in browser.find_all_responses("api/data")] == [
+                {"v": 3}
+            ]
+
+    async def test_find_response_after_miss_sees_new_responses(self):
+        """Verify a pattern that missed is still found once a match is captured."""
+        async with make_extractor() as browser:
+            browser._record(make_captured_response(url="https://example.com/a"))  # pylint: disable=protected-access
+            assert browser.find_response("api/data") is None
+
+            browser._record(make_captured_response(body={"v": 1}))  # pylint: disable=protected-access
+            browser._record(make_captured_response(url="https://example.com/b"))  # pylint: disable=protected-access
+            result = browser.find_response("api/data")
+            assert result is not None
+            assert result.body == {"v": 1}
+            assert len(browser.find_all_responses("api/data")) == 1
+
+    async def test_lookup_after_responses_changed_in_place(self):
+        """Verify lookups see items replaced in place without changing the length."""
+        async with make_extractor() as browser:
+            browser.responses = [
+                make_captured_response(body={"v": 1}),
+                make_captured_response(url="https://example.com/other"),
+                make_captured_response(url="https://example.com/tail"),
+            ]
+            assert len(browser.find_all_responses("api/data")) == 1
+
+            browser.responses[1] = make_captured_response(
+                url="https://example.com/api/data?v=2", body={"v": 2}
+            )
+            assert [r.body for r in browser.find_all_responses("api/data")] == [
+                {"v": 1},
+                {"v": 2},
+            ]
+
+            browser.responses[0] = make_captured_response(
+                url="https://example.com/other"
+            )
+            browser.responses[1] = make_captured_response(
+                url="https://example.com/other"
+            )
+            assert browser.find_response("api/data") is None
+            browser.responses[0] = make_captured_response(body={"v": 3})
+            result = browser.find_response("api/data")
+            assert result is not None
+            assert result.body == {"v": 3}
+
+    async def test_max_captured_responses_evicts_oldest(self):
+        """Verify only the newest max_captured_responses are kept and still found."""
+        async with make_extractor(max_captured_responses=2) as browser:
+            browser._record(make_captured_response(body={"v": 1}))  # pylint: disable=protected-access
+            assert len(browser.find_all_responses("api/data")) == 1
+
+            browser._record(make_captured_response(body={"v": 2}))  # pylint: disable=protected-access
+            browser._record(make_captured_response(body={"v": 3}))  # pylint: disable=protected-access
+            assert [r.body for r in browser.responses] == [{"v": 2}, {"v": 3}]
+            assert [r.body for r in browser.find_all_responses("api/data")] == [
+                {"v": 2},
+                {"v": 3},
+            ]
+            result = browser.find_response("api/data")
+            assert result is not None
+            assert result.body == {"v": 3}
+
+    async def test_clear_and_drop_older_than(self):
+        """Verify drop_older_than evicts by capture time and clear empties everything."""
+        async with make_extractor() as browser:
+            with patch("pwbase.browser_session_extractor.time.monotonic") as now:
+                now.return_value = 100.0
+                browser._record(make_captured_response(body={"v": 1}))  # pylint: disable=protected-access
+                now.return_value = 110.0
+                browser._record(make_captured_response(body={"v": 2}))  # pylint: disable=protected-access
+                assert len(browser.find_all_responses("api/data")) == 2
+
+                now.return_value = 115.0
+                assert browser.drop_older_than(10) == 1
+            assert [r.body for r in browser.find_all_responses("api/data")] == [
+                {"v": 2}
+            ]
+
+            browser.clear()
+            assert len(browser.responses) == 0
+            assert browser.find_response("api/data") is None
+
+    async def test_drop_older_than_after_responses_changed_in_place(self):
+        """Verify responses added directly are not dropped using stale capture times."""
+        async with make_extractor() as browser:
+            with patch("pwbase.browser_session_extractor.time.monotonic") as now:
+                now.return_value = 100.0
+                browser._record(make_captured_response(body={"v": 1}))  # pylint: disable=protected-access
+                browser.responses.clear()
+                browser.responses.append(make_captured_response(body={"v": 2}))
+
+                now.return_value = 115.0
+                assert browser.drop_older_than(10) == 0
+            assert [r.body for r in browser.responses] == [{"v": 2}]
+
+    async def test_wait_for_response_no_page(self):
         """Verify wait_for_response raises RuntimeError when no page is being recorded."""
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                with pytest.raises(RuntimeError, match="No page is being recorded"):
-                    await browser.wait_for_response("api/data")
-
-    async def test_wait_for_response_found_immediately(
-        self, mock_async_playwright, mock_page
-    ):
+        async with make_extractor() as browser:
+            with pytest.raises(RuntimeError, match="No page is being recorded"):
+                await browser.wait_for_response("api/data")
+
+    async def test_wait_for_response_found_immediately(self, mock_page):
         """Verify wait_for_response returns immediately when the response is already captured."""
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                await browser.start_recording(mock_page)
-                browser.responses = [
-                    make_captured_response()
-                ]  # set AFTER start_recording
-                result = await browser.wait_for_response("api/data")
-                assert result is not None
-                mock_page.wait_for_timeout.assert_not_called()
+        async with make_extractor() as browser:
+            await browser.start_recording(mock_page)
+            browser.responses = [
+                make_captured_response()
+            ]  # set AFTER start_recording
+            result = await browser.wait_for_response("api/data")
+            assert result is not None
+            mock_page.wait_for_timeout.assert_not_called()
+
+    async def test_wait_for_response_resolves_on_capture(self, mock_page):
+        """Verify wait_for_response resolves as soon as a matching response is captured."""
+        mock_response = make_mock_response("https://example.com/api/data")
+        async with make_extractor() as browser:
+            await browser.start_recording(mock_page)
+            waiter = asyncio.create_task(
+                browser.wait_for_response("api/data", timeout=1)
+            )
+            await asyncio.sleep(0)
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            result = await waiter
+            assert result.url == "https://example.com/api/data"
+            mock_page.wait_for_timeout.assert_not_called()
+
+    async def test_wait_for_response_timeout(self, mock_page):
+        """Verify wait_for_response raises TimeoutError once the deadline passes."""
+        async with make_extractor() as browser:
+            await browser.start_recording(mock_page)
+            with pytest.raises(TimeoutError):
+                await browser.wait_for_response("api/data", timeout=0.01)
+            assert browser._waiters == []  # pylint: disable=protected-access
+
+    async def test_wait_for_response_polls_until_found(self, mock_page):
+        """Verify poll_interval re-checks responses until one added directly matches."""
+        async with make_extractor() as browser:
+            await browser.start_recording(mock_page)
+
+            async def tick(_ms):
+                if mock_page.wait_for_timeout.await_count == 3:
+                    browser.responses.append(make_captured_response())
+
+            mock_page.wait_for_timeout.side_effect = tick
+            result = await browser.wait_for_response("api/data", poll_interval=0.5)
+            assert result.url == "https://example.com/api/data"
+            assert mock_page.wait_for_timeout.await_count == 3
+            mock_page.wait_for_timeout.assert_awaited_with(500)
+
+    async def test_wait_for_response_poll_timeout(self, mock_page):
+        """Verify the timeout still raises TimeoutError when poll_interval is set."""
+
+        async def tick(ms):
+            await asyncio.sleep(ms / 1000)
+
+        mock_page.wait_for_timeout.side_effect = tick
+        async with make_extractor() as browser:
+            await browser.start_recording(mock_page)
+            with pytest.raises(TimeoutError):
+                await browser.wait_for_response(
+                    "api/data", timeout=0.05, poll_interval=0.01
+                )
+            assert mock_page.wait_for_timeout.await_count >= 2
+
+    async def test_stop_recording_fails_pending_waiters(self, mock_page):
+        """Verify stop_recording makes a pending wait_for_response raise."""
+        async with make_extractor() as browser:
+            await browser.start_recording(mock_page)
+            waiter = asyncio.create_task(browser.wait_for_response("api/data"))
+            await asyncio.sleep(0)
+            browser.stop_recording()
+            with pytest.raises(RuntimeError, match="Recording stopped"):
+                await waiter
+            assert browser._waiters == []  # pylint: disable=protected-access
+
+    async def test_stop_fails_pending_waiters(self, mock_page):
+        """Verify stop() also ends a pending wait_for_response."""
+        browser = make_extractor()
+        await browser.start()
+        await browser.start_recording(mock_page)
+        waiter = asyncio.create_task(browser.wait_for_response("api/data"))
+        await asyncio.sleep(0)
+        await browser.stop()
+        with pytest.raises(RuntimeError, match="Recording stopped"):
+            await waiter
 
 
 # ── Session extraction ────────────────────────────────────────────────────────
@@ -258,37 +626,61 @@ class TestQuerying:
 class TestSessionExtraction:
     """Tests for converting captured responses into requests Session objects."""
 
-    async def test_to_session_sets_headers(self, mock_async_playwright):
+    async def test_to_session_sets_headers(self):
         """Verify to_session copies request headers and filters out HTTP/2 pseudo-headers."""
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                response = make_captured_response(
-                    request_headers={"authorization": "Bearer token", ":method": "GET"}
-                )
-                session = browser.to_session(response)
-                assert session.headers["authorization"] == "Bearer token"
-                assert ":method" not in session.headers  # pseudo headers filtered out
-
-    async def test_to_session_sets_cookies(self, mock_async_playwright):
+        async with make_extractor() as browser:
+            response = make_captured_response(
+                request_headers={"authorization": "Bearer token", ":method": "GET"}
+            )
+            session = browser.to_session(response)
+            assert session.headers["authorization"] == "Bearer token"
+            assert ":method" not in session.headers  # pseudo headers filtered out
+
+    async def test_to_session_sets_cookies(self):
         """Verify to_session populates the session cookie jar from captured cookies."""
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_extractor() as browser:
-                response = make_captured_response(
-                    cookies=[
-                        {
-                            "name": "session",
-                            "value": "abc123",
-                            "domain": ".example.com",
-                            "path": "/",
-                        }
-                    ]
-                )
-                session = browser.to_session(response)
-                assert session.cookies.get("session") == "abc123"
+        async with make_extractor() as browser:
+            response = make_captured_response(
+                cookies=[
+                    {
+                        "name": "session",
+                        "value": "abc123",
+                        "domain": ".example.com",
+                        "path": "/",
+                    }
+                ]
+            )
+            session = browser.to_session(response)
+            assert session.cookies.get("session") == "abc123"
+
+    async def test_to_session_shares_connection_pools(self):
+        """Verify sessions share adapters but mounting on one leaves the others alone."""
+        async with make_extractor() as browser:
+            first = browser.to_session(make_captured_response())
+            second = browser.to_session(make_captured_response())
+            assert first.adapters["https://"] is second.adapters["https://"]
+
+            first.mount("https://", MagicMock())
+            assert first.adapters["https://"] is not second.adapters["https://"]
+
+    async def test_to_session_close_keeps_shared_pools(self):
+        """Verify closing one session closes its own adapters but not the shared ones."""
+        async with make_extractor() as browser:
+            first = browser.to_session(make_captured_response())
+            second = browser.to_session(make_captured_response())
+            own = MagicMock()
+            first.mount("https://", own)
+            with patch.object(second.adapters["http://"], "close") as shared_close:
+                with first:
+                    pass
+            own.close.assert_called_once_with()
+            shared_close.assert_not_called()
+
+
+def test_max_captured_responses_must_be_positive():
+    """Verify a non-positive max_captured_responses is rejected."""
+    with pytest.raises(ValueError, match="max_captured_responses"):
+        BrowserConfig(max_captured_responses=0)
+    assert BrowserConfig(max_captured_responses=None).max_captured_responses is None
 
 
 # ── AllRequestExtractor — init (sync) ────────────────────────────────────────
@@ -331,136 +723,104 @@ class TestAllRequestExtractor:
 
     # -- GET / POST filtering -------------------------------------------------
 
-    async def test_captures_get_request(self, mock_async_playwright):
+    async def test_captures_get_request(self):
         """Verify GET requests are captured."""
         mock_response = make_all_mock_response(
             "https://example.com/api/data", method="GET"
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor(exclude_content_types=()) as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 1
-
-    async def test_captures_post_request(self, mock_async_playwright):
+        async with make_all_extractor(exclude_content_types=()) as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 1
+
+    async def test_captures_post_request(self):
         """Verify POST requests are captured."""
         mock_response = make_all_mock_response(
             "https://example.com/api/submit", method="POST"
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor(exclude_content_types=()) as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 1
-
-    async def test_ignores_put_request(self, mock_async_playwright):
+        async with make_all_extractor(exclude_content_types=()) as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 1
+
+    async def test_ignores_put_request(self):
         """Verify PUT requests are not captured."""
         mock_response = make_all_mock_response(
             "https://example.com/api/update", method="PUT"
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor(exclude_content_types=()) as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 0
-
-    async def test_ignores_delete_request(self, mock_async_playwright):
+        async with make_all_extractor(exclude_content_types=()) as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 0
+
+    async def test_ignores_delete_request(self):
         """Verify DELETE requests are not captured."""
         mock_response = make_all_mock_response(
             "https://example.com/api/item", method="DELETE"
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor(exclude_content_types=()) as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 0
+        async with make_all_extractor(exclude_content_types=()) as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 0
 
     # -- Content-type exclusions ----------------------------------------------
 
-    async def test_excludes_css_by_default(self, mock_async_playwright):
+    async def test_excludes_css_by_default(self):
         """Verify CSS responses are excluded with default settings."""
         mock_response = make_all_mock_response(
             "https://example.com/styles.css", content_type="text/css"
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor() as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 0
-
-    async def test_excludes_javascript_by_default(self, mock_async_playwright):
+        async with make_all_extractor() as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 0
+
+    async def test_excludes_javascript_by_default(self):
         """Verify JavaScript responses are excluded with default settings."""
         mock_response = make_all_mock_response(
             "https://example.com/app.js", content_type="text/javascript"
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor() as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 0
-
-    async def test_excludes_application_javascript_by_default(
-        self, mock_async_playwright
-    ):
+        async with make_all_extractor() as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 0
+
+    async def test_excludes_application_javascript_by_default(self):
         """Verify application/javascript responses are excluded with default settings."""
         mock_response = make_all_mock_response(
             "https://example.com/bundle.js", content_type="application/javascript"
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor() as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 0
-
-    async def test_excludes_images_by_default(self, mock_async_playwright):
+        async with make_all_extractor() as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 0
+
+    async def test_excludes_images_by_default(self):
         """Verify image responses are excluded with default settings."""
         mock_response = make_all_mock_response(
             "https://example.com/logo.png", content_type="image/png"
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor() as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 0
-
-    async def test_excludes_fonts_by_default(self, mock_async_playwright):
+        async with make_all_extractor() as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 0
+
+    async def test_excludes_fonts_by_default(self):
         """Verify font responses are excluded with default settings."""
         mock_response = make_all_mock_response(
             "https://example.com/font.woff2", content_type="font/woff2"
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor() as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 0
-
-    async def test_captures_css_when_not_excluded(self, mock_async_playwright):
+        async with make_all_extractor() as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 0
+
+    async def test_captures_css_when_not_excluded(self):
         """Verify CSS is captured when excluded_content_types is empty."""
         mock_response = make_all_mock_response(
             "https://example.com/styles.css",
             content_type="text/css",
             body=b"body { color: red; }",
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor(exclude_content_types=()) as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 1
-                assert browser.responses[0].body == "body { color: red; }"
+        async with make_all_extractor(exclude_content_types=()) as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 1
+            assert browser.responses[0].body == "body { color: red; }"
 
     # -- Body parsing ---------------------------------------------------------
 
-    async def test_json_body_parsed_as_dict(self, mock_async_playwright):
+    async def test_json_body_parsed_as_dict(self):
         """Verify JSON responses are parsed into dicts."""
         payload = {"user": "alice", "token": "xyz"}
         mock_response = make_all_mock_response(
@@ -468,14 +828,11 @@ class TestAllRequestExtractor:
             content_type="application/json",
             body=json.dumps(payload).encode(),
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor(exclude_content_types=()) as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert browser.responses[0].body == payload
-
-    async def test_html_body_stored_as_string(self, mock_async_playwright):
+        async with make_all_extractor(exclude_content_types=()) as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert browser.responses[0].body == payload
+
+    async def test_html_body_stored_as_string(self):
         """Verify HTML responses are stored as decoded strings."""
         html = b"<html><body>Hello</body></html>"
         mock_response = make_all_mock_response(
@@ -483,41 +840,32 @@ class TestAllRequestExtractor:
             content_type="text/html",
             body=html,
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor(exclude_content_types=()) as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert browser.responses[0].body == html.decode()
-
-    async def test_plain_text_body_stored_as_string(self, mock_async_playwright):
+        async with make_all_extractor(exclude_content_types=()) as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert browser.responses[0].body == html.decode()
+
+    async def test_plain_text_body_stored_as_string(self):
         """Verify plain text responses are stored as decoded strings."""
         mock_response = make_all_mock_response(
             "https://example.com/health",
             content_type="text/plain",
             body=b"OK",
         )
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor(exclude_content_types=()) as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert browser.responses[0].body == "OK"
-
-    async def test_body_error_silently_skipped(self, mock_async_playwright):
+        async with make_all_extractor(exclude_content_types=()) as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert browser.responses[0].body == "OK"
+
+    async def test_body_error_silently_skipped(self):
         """Verify responses that fail body retrieval are silently skipped."""
         mock_response = make_all_mock_response("https://example.com/api/data")
         mock_response.body = AsyncMock(side_effect=Exception("network error"))
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor(exclude_content_types=()) as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                assert len(browser.responses) == 0
+        async with make_all_extractor(exclude_content_types=()) as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            assert len(browser.responses) == 0
 
     # -- Captured response fields ---------------------------------------------
 
-    async def test_captured_response_fields(self, mock_async_playwright):
+    async def test_captured_response_fields(self):
         """Verify all CapturedResponse fields are populated correctly."""
         payload = {"id": 1}
         mock_response = make_all_mock_response(
@@ -527,13 +875,10 @@ class TestAllRequestExtractor:
             body=json.dumps(payload).encode(),
         )
         mock_response.request.post_data = '{"id": 1}'
-        with patch(
-            "pwbase.browser.async_playwright", return_value=mock_async_playwright
-        ):
-            async with make_all_extractor(exclude_content_types=()) as browser:
-                await browser._handle_response(mock_response)  # pylint: disable=protected-access
-                captured = browser.responses[0]
-                assert captured.url == "https://example.com/api/item"
-                assert captured.method == "POST"
-                assert captured.body == payload
-                assert captured.request_post_data == '{"id": 1}'
+        async with make_all_extractor(exclude_content_types=()) as browser:
+            await browser._handle_response(mock_response)  # pylint: disable=protected-access
+            captured = browser.responses[0]
+            assert captured.url == "https://example.com/api/item"
+            assert captured.method == "POST"
+            assert captured.body == payload
+            assert captured.request_post_data == '{"id": 1}'
@@ -7,93 +7,127 @@ Split into two groups:
   No browser is launched; the extractor is instantiated but never started.
 
 * ``TestRecordingReal`` — exercises the recording pipeline with an actual
-  headless Chromium instance.  ``page.route()`` is used to serve controlled
-  JSON (and non-JSON) responses at ``https://test.internal/...`` URLs so the
+  headless Chromium instance, shared across the session (see ``conftest.py``).
+  One ``page.route()`` handler serves controlled JSON (and non-JSON) responses
+  at ``https://test.internal/...`` URLs from a precomputed table, so the
   tests are hermetic and require no external network access.
 """
 
 import asyncio
 import json
+from dataclasses import replace
+from urllib.parse import urlsplit
 
 import pytest
 import requests
 
 from pwbase import BrowserConfig, BrowserSessionExtractor, BrowserType, CapturedResponse
 
-pytestmark = pytest.mark.asyncio
-
 # ── Shared helpers ────────────────────────────────────────────────────────────
 
 
+# ``share_browser`` lets every started extractor reuse the session-scoped
+# Chromium held open by the ``shared_default_browser`` fixture.
+_CONFIG = BrowserConfig(type=BrowserType.DEFAULT, headless=True, share_browser=True)
+
+
 def _extractor(**kwargs) -> BrowserSessionExtractor:
-    return BrowserSessionExtractor(
-        BrowserConfig(type=BrowserType.DEFAULT, headless=True, **kwargs)
-    )
+    return BrowserSessionExtractor(replace(_CONFIG, **kwargs) if kwargs else _CONFIG)
+
+
+# Shared by every _response() result; tests must not mutate its containers.
+_DEFAULT_RESPONSE = CapturedResponse(
+    url="https://example.com/api/data",
+    method="GET",
+    headers={"content-type": "application/json"},
+    body={"key": "value"},
+    request_headers={"authorization": "Bearer token", ":method": "GET"},
+    request_post_data=None,
+    cookies=[],
+)
 
 
 def _response(**kwargs) -> CapturedResponse:
-    defaults = dict(
-        url="https://example.com/api/data",
-        method="GET",
-        headers={"content-type": "application/json"},
-        body={"key": "value"},
-        request_headers={"authorization": "Bearer token", ":method": "GET"},
-        request_post_data=None,
-        cookies=[],
-    )
-    return CapturedResponse(**{**defaults, **kwargs})
-
-
-async def _route_json(route, body: dict) -> None:
-    """Route handler that fulfills with JSON."""
-    await route.fulfill(
-        status=200,
-        headers={"content-type": "application/json"},
-        body=json.dumps(body),
-    )
-
-
-async def _route_html(route) -> None:
-    """Route handler that fulfills with plain HTML."""
-    await route.fulfill(
-        status=200,
-        headers={"content-type": "text/html; charset=utf-8"},
-        body="<html><body>Hello</body></html>",
-    )
-
-
-def _json_handler(body: dict):
-    """Return a one-parameter route handler that fulfills with ``body`` as JSON.
-
-    Playwright inspects the arity of the handler.  A two-parameter handler
-    (``route, request``) receives the live ``Request`` object as its second
-    argument, so any default-arg trick like ``lambda route, b=body: ...``
-    breaks — ``b`` gets overwritten with the ``Request`` object.  This factory
-    creates a proper closure so the handler has exactly one parameter.
-    """
+    return replace(_DEFAULT_RESPONSE, **kwargs)
 
-    async def handler(route):
-        await _route_json(route, body)
 
-    return handler
+@pytest.fixture(scope="module")
+def _module_session() -> requests.Session:
+    return requests.Session()
 
 
-async def _goto_and_wait(
-    page, url: str, extractor: "BrowserSessionExtractor", expected: int = 1
-) -> None:
-    """Navigate to ``url`` and poll until ``extractor.responses`` reaches ``expected`` length.
+@pytest.fixture
+def fresh_session(_module_session):
+    """One ``requests.Session`` per module, emptied after each test.
+
+    Header and cookie tests apply a response to it directly instead of paying
+    for a new session (and its default adapters) through ``to_session()``.
+    """
+    yield _module_session
+    _module_session.headers.clear()
+    _module_session.cookies.clear()
+
+
+_ORIGIN = "https://test.internal"
+
+# Path -> JSON payload served under ``_ORIGIN``; any other path gets HTML.
+_PAYLOADS: dict[str, dict] = {
+    "/api/data": {"hello": "world", "count": 42},
+    "/api/item": {},
+    "/api/item0": {"n": 1},
+    "/api/item1": {"n": 2},
+    "/api/item2": {"n": 3},
+    "/api/first": {"n": 1},
+    "/api/second": {"n": 2},
+    "/api/users": {"users": []},
+    "/api/a": {"a": 1},
+}
+_ROUTES: dict[str, bytes] = {
+    path: json.dumps(payload).encode() for path, payload in _PAYLOADS.items()
+}
+_JSON_HEADERS = {"content-type": "application/json"}
+_HTML_HEADERS = {"content-type": "text/html; charset=utf-8"}
+_HTML_BODY = b"<html><body>Hello</body></html>"
+
+
+async def _dispatch(route) -> None:
+    """Fulfil a ``_ORIGIN`` request from ``_ROUTES``, falling back to HTML."""
+    body = _ROUTES.get(urlsplit(route.request.url).path)
+    if body is None:
+        await route.fulfill(status=200, headers=_HTML_HEADERS, body=_HTML_BODY)
+    else:
+        await route.fulfill(status=200, headers=_JSON_HEADERS, body=body)
+
+
+async def _serve(page) -> None:
+    """Route every ``_ORIGIN`` request on ``page`` through ``_dispatch`` and
+    load the origin's HTML page once, so later ``_fetch()`` calls are
+    same-origin and need no further navigation."""
+    await page.route(f"{_ORIGIN}/**", _dispatch)
+    await page.goto(f"{_ORIGIN}/")
+
+
+async def _fetch(page, url: str) -> None:
+    """Request ``url`` with ``fetch()`` from the page and read the whole body.
+
+    This still fires the page's "response" event but skips the navigation
+    (document parsing, load events) that ``page.goto()`` would trigger.
+    """
+    await page.evaluate("url => fetch(url).then(r => r.text())", url)
+
+
+async def _fetch_and_wait(
+    page, url: str, extractor: "BrowserSessionExtractor"
+) -> CapturedResponse:
+    """Fetch ``url`` and wait until the extractor has captured its response.
 
     Playwright fires the "response" event and schedules ``_handle_response`` as
-    an asyncio task.  ``page.goto()`` resolves before that task completes, so
-    we need to yield to the event loop and poll until the handler finishes.
+    an asyncio task.  ``_fetch()`` resolves before that task completes, so
+    this waits on ``wait_for_response()``, which resolves as soon as the
+    handler records the response.
     """
-    await page.goto(url)
-    deadline = 3.0  # seconds
-    interval = 0.02
-    elapsed = 0.0
-    while len(extractor.responses) < expected and elapsed < deadline:
-        await asyncio.sleep(interval)
-        elapsed += interval
+    await _fetch(page, url)
+    return await extractor.wait_for_response(url, timeout=3.0)
 
 
 # ── Pure in-memory tests (no browser) ────────────────────────────────────────
@@ -105,26 +139,26 @@ class TestPureInMemory:
 
     # ── Initial state ─────────────────────────────────────────────────────────
 
-    async def test_initial_responses_empty(self):
+    def test_initial_responses_empty(self):
         """A freshly created extractor has an empty responses list."""
         extractor = _extractor()
-        assert extractor.responses == []
+        assert list(extractor.responses) == []
 
-    async def test_initial_page_is_none(self):
+    def test_initial_page_is_none(self):
         """No page is recorded until start_recording() is called."""
         extractor = _extractor()
         assert extractor._page is None  # pylint: disable=protected-access
 
     # ── stop_recording guard ──────────────────────────────────────────────────
 
-    async def test_stop_recording_before_start_is_safe(self):
+    def test_stop_recording_before_start_is_safe(self):
         """stop_recording() is a no-op when recording was never started."""
         extractor = _extractor()
         extractor.stop_recording()  # must not raise
 
     # ── find_response ─────────────────────────────────────────────────────────
 
-    async def test_find_response_returns_most_recent_match(self):
+    def test_find_response_returns_most_recent_match(self):
         """find_response returns the last response whose URL contains the pattern."""
         extractor = _extractor()
         extractor.responses = [
@@ -135,18 +169,18 @@ class TestPureInMemory:
         assert result is not None
         assert result.body == {"v": 2}
 
-    async def test_find_response_returns_none_when_no_match(self):
+    def test_find_response_returns_none_when_no_match(self):
         """find_response returns None when no URL matches the pattern."""
         extractor = _extractor()
         extractor.responses = [_response()]
         assert extractor.find_response("api/missing") is None
 
-    async def test_find_response_returns_none_on_empty_list(self):
+    def test_find_response_returns_none_on_empty_list(self):
         """find_response returns None when the responses list is empty."""
         extractor = _extractor()
         assert extractor.find_response("api/data") is None
 
-    async def test_find_response_partial_url_match(self):
+    def test_find_response_partial_url_match(self):
         """find_response matches any substring of the URL."""
         extractor = _extractor()
         extractor.responses = [_response(url="https://example.com/api/v2/users/123")]
@@ -154,7 +188,7 @@ class TestPureInMemory:
 
     # ── find_all_responses ────────────────────────────────────────────────────
 
-    async def test_find_all_responses_returns_all_matches(self):
+    def test_find_all_responses_returns_all_matches(self):
         """find_all_responses returns every response matching the pattern."""
         extractor = _extractor()
         extractor.responses = [
@@ -165,13 +199,13 @@ class TestPureInMemory:
         results = extractor.find_all_responses("api/data")
         assert len(results) == 2
 
-    async def test_find_all_responses_empty_when_no_match(self):
+    def test_find_all_responses_empty_when_no_match(self):
         """find_all_responses returns an empty list when no URLs match."""
         extractor = _extractor()
         extractor.responses = [_response()]
         assert extractor.find_all_responses("api/missing") == []
 
-    async def test_find_all_responses_preserves_order(self):
+    def test_find_all_responses_preserves_order(self):
         """find_all_responses preserves capture order (oldest first)."""
         extractor = _extractor()
         extractor.responses = [
@@ -191,28 +225,26 @@ class TestPureInMemory:
 
     # ── to_session ────────────────────────────────────────────────────────────
 
-    async def test_to_session_returns_requests_session(self):
+    def test_to_session_returns_requests_session(self):
         """to_session returns a requests.Session instance."""
         extractor = _extractor()
         session = extractor.to_session(_response())
         assert isinstance(session, requests.Session)
 
-    async def test_to_session_copies_request_headers(self):
+    def test_to_session_copies_request_headers(self, fresh_session):
         """to_session copies non-pseudo request headers onto the session."""
-        extractor = _extractor()
         resp = _response(
             request_headers={
                 "authorization": "Bearer abc",
                 "accept": "application/json",
             }
         )
-        session = extractor.to_session(resp)
-        assert session.headers["authorization"] == "Bearer abc"
-        assert session.headers["accept"] == "application/json"
+        resp._apply_to_session(fresh_session)  # pylint: disable=protected-access
+        assert fresh_session.headers["authorization"] == "Bearer abc"
+        assert fresh_session.headers["accept"] == "application/json"
 
-    async def test_to_session_filters_pseudo_headers(self):
+    def test_to_session_filters_pseudo_headers(self, fresh_session):
         """HTTP/2 pseudo-headers (prefixed with ':') are excluded from the session."""
-        extractor = _extractor()
         resp = _response(
             request_headers={
                 ":method": "GET",
@@ -220,13 +252,12 @@ class TestPureInMemory:
                 "authorization": "Bearer x",
             }
         )
-        session = extractor.to_session(resp)
-        assert ":method" not in session.headers
-        assert ":path" not in session.headers
+        resp._apply_to_session(fresh_session)  # pylint: disable=protected-access
+        assert ":method" not in fresh_session.headers
+        assert ":path" not in fresh_session.headers
 
-    async def test_to_session_sets_cookies(self):
+    def test_to_session_sets_cookies(self, fresh_session):
         """to_session populates the cookie jar from captured cookies."""
-        extractor = _extractor()
         resp = _response(
             cookies=[
                 {
@@ -237,38 +268,49 @@ class TestPureInMemory:
                 },
             ]
         )
-        session = extractor.to_session(resp)
-        assert session.cookies.get("session") == "abc123"
+        resp._apply_to_session(fresh_session)  # pylint: disable=protected-access
+        assert fresh_session.cookies.get("session") == "abc123"
 
-    async def test_to_session_multiple_cookies(self):
+    def test_to_session_multiple_cookies(self, fresh_session):
         """All captured cookies are added to the session cookie jar."""
-        extractor = _extractor()
         resp = _response(
             cookies=[
                 {"name": "a", "value": "1", "domain": ".example.com", "path": "/"},
                 {"name": "b", "value": "2", "domain": ".example.com", "path": "/"},
             ]
         )
-        session = extractor.to_session(resp)
-        assert session.cookies.get("a") == "1"
-        assert session.cookies.get("b") == "2"
-
-    async def test_to_session_empty_cookies(self):
+        resp._apply_to_session(fresh_session)  # pylint: disable=protected-access
+        assert fresh_session.cookies.get("a") == "1"
+        assert fresh_session.cookies.get("b") == "2"
+
+    def test_to_session_cookie_without_domain_or_path(self, fresh_session):
+        """A cookie with no domain or path is set for any host on path '/'."""
+        resp = _response(cookies=[{"name": "a", "value": "1"}])
+        resp._apply_to_session(fresh_session)  # pylint: disable=protected-access
+        (cookie,) = fresh_session.cookies
+        assert (cookie.name, cookie.value) == ("a", "1")
+        assert (cookie.domain, cookie.path) == ("", "/")
+
+    def test_to_session_empty_cookies(self, fresh_session):
         """to_session works cleanly when no cookies were captured."""
-        extractor = _extractor()
         resp = _response(cookies=[])
-        session = extractor.to_session(resp)
-        assert len(list(session.cookies)) == 0
+        resp._apply_to_session(fresh_session)  # pylint: disable=protected-access
+        assert len(list(fresh_session.cookies)) == 0
 
 
 # ── Real browser tests ────────────────────────────────────────────────────────
 
 
+@pytest.mark.slow
+@pytest.mark.usefixtures("shared_default_browser")
 class TestRecordingReal:
     """Recording pipeline tests with a live headless Chromium browser.
 
-    ``page.route()`` intercepts requests to ``https://test.internal/...`` so
-    no external network connection is needed.
+    Each test gets its own context on the session-shared Chromium process.
+
+    ``_serve()`` intercepts requests to ``https://test.internal/...`` so no
+    external network connection is needed, and responses are requested with
+    ``fetch()`` from one loaded page rather than by navigating to each URL.
     """
 
     async def test_start_recording_clears_previous_responses(self):
@@ -300,30 +342,23 @@ class TestRecordingReal:
         """A JSON response from a routed URL is captured in extractor.responses."""
         async with _extractor() as extractor:
             page = await extractor.get_page()
-            payload = {"hello": "world", "count": 42}
-
-            await page.route(
-                "https://test.internal/api/data",
-                lambda route: _route_json(route, payload),
-            )
+            await _serve(page)
             await extractor.start_recording(page)
-            await _goto_and_wait(page, "https://test.internal/api/data", extractor)
+            await _fetch_and_wait(page, "https://test.internal/api/data", extractor)
 
             assert len(extractor.responses) == 1
             captured = extractor.responses[0]
             assert captured.url == "https://test.internal/api/data"
-            assert captured.body == payload
+            assert captured.body == _PAYLOADS["/api/data"]
 
     async def test_captured_response_method(self):
         """The captured response records the correct HTTP method."""
         async with _extractor() as extractor:
             page = await extractor.get_page()
 
-            await page.route(
-                "https://test.internal/api/item", lambda route: _route_json(route, {})
-            )
+            await _serve(page)
             await extractor.start_recording(page)
-            await _goto_and_wait(page, "https://test.internal/api/item", extractor)
+            await _fetch_and_wait(page, "https://test.internal/api/item", extractor)
 
             assert extractor.responses[0].method == "GET"
 
@@ -332,54 +367,43 @@ class TestRecordingReal:
         async with _extractor() as extractor:
             page = await extractor.get_page()
 
-            await page.route(
-                "https://test.internal/page", lambda route: _route_html(route)
-            )
+            await _serve(page)
             await extractor.start_recording(page)
-            await page.goto("https://test.internal/page")
+            await _fetch(page, "https://test.internal/page")
 
-            assert extractor.responses == []
+            assert list(extractor.responses) == []
 
     async def test_captures_multiple_json_responses(self):
         """Each JSON response encountered during recording is captured separately."""
         async with _extractor() as extractor:
             page = await extractor.get_page()
-            payloads = [{"n": 1}, {"n": 2}, {"n": 3}]
-            urls = [f"https://test.internal/api/item{i}" for i in range(3)]
-
-            for url, body in zip(urls, payloads):
-                await page.route(url, _json_handler(body))
+            paths = [f"/api/item{i}" for i in range(3)]
 
+            await _serve(page)
             await extractor.start_recording(page)
-            for i, url in enumerate(urls, start=1):
-                await _goto_and_wait(page, url, extractor, expected=i)
+            for path in paths:
+                await _fetch_and_wait(page, _ORIGIN + path, extractor)
 
             assert len(extractor.responses) == 3
-            assert [r.body for r in extractor.responses] == payloads
+            assert [r.body for r in extractor.responses] == [
+                _PAYLOADS[path] for path in paths
+            ]
 
     async def test_stop_recording_stops_capturing(self):
         """After stop_recording(), subsequent JSON responses are not captured."""
         async with _extractor() as extractor:
             page = await extractor.get_page()
 
-            await page.route(
-                "https://test.internal/api/first",
-                lambda route: _route_json(route, {"n": 1}),
-            )
-            await page.route(
-                "https://test.internal/api/second",
-                lambda route: _route_json(route, {"n": 2}),
-            )
-
+            await _serve(page)
             await extractor.start_recording(page)
-            await _goto_and_wait(
-                page, "https://test.internal/api/first", extractor, expected=1
-            )
+            await _fetch_and_wait(page, "https://test.internal/api/first", extractor)
             extractor.stop_recording()
-            await page.goto("https://test.internal/api/second")
-            await asyncio.sleep(
-                0.1
-            )  # give the (detached) handler a chance to (not) fire
+            await _fetch(page, "https://test.internal/api/second")
+            # The response event precedes the fetched body, so it has been
+            # dispatched by now; a few zero-delay yields let any already-scheduled
+            # handler task run (and, being detached, not record anything).
+            for _ in range(5):
+                await asyncio.sleep(0)
 
             assert len(extractor.responses) == 1
             assert extractor.responses[0].body == {"n": 1}
@@ -389,12 +413,9 @@ class TestRecordingReal:
         async with _extractor() as extractor:
             page = await extractor.get_page()
 
-            await page.route(
-                "https://test.internal/api/users",
-                lambda route: _route_json(route, {"users": []}),
-            )
+            await _serve(page)
             await extractor.start_recording(page)
-            await _goto_and_wait(page, "https://test.internal/api/users", extractor)
+            await _fetch_and_wait(page, "https://test.internal/api/users", extractor)
 
             result = extractor.find_response("api/users")
             assert result is not None
@@ -405,16 +426,11 @@ class TestRecordingReal:
         async with _extractor() as extractor:
             page = await extractor.get_page()
 
-            await page.route(
-                "https://test.internal/api/a",
-                lambda route: _route_json(route, {"a": 1}),
-            )
+            await _serve(page)
             await extractor.start_recording(page)
-            await _goto_and_wait(
-                page, "https://test.internal/api/a", extractor, expected=1
-            )
+            await _fetch_and_wait(page, "https://test.internal/api/a", extractor)
             assert len(extractor.responses) == 1
 
             # Second start_recording resets the list
             await extractor.start_recording(page)
-            assert extractor.responses == []
+            assert list(extractor.responses) == []